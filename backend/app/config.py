@@ -32,6 +32,9 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     anthropic_api_key: str = ""
 
+    # Concurrent LLM requests when extracting cross-references (one per batch of findings)
+    cross_ref_max_workers: int = 4
+
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
@@ -16,7 +16,7 @@ from ..database import get_db
 logger = logging.getLogger(__name__)
 from ..models import Session as SessionModel, ConsultationFinding, CompanyInfo, MaturityAssessment
 from ..services.pdf_generator import PDFReportGenerator
-from ..services.default_prompts import get_prompt
+from ..services.default_prompts import render_prompt
 from ..services.session_settings import get_llm_settings, get_temperature_config
 from ..config import settings
 from ..utils.security import validate_api_base
@@ -239,10 +239,10 @@ def generate_transition_briefing(
 
     # Get the prompt template - use session language setting if available
     language = body.language or db_session.prompt_language or "en"
-    prompt_template = get_prompt("transition_briefing_system", language)
-
     # Fill in the template
-    filled_prompt = prompt_template.format(
+    filled_prompt = render_prompt(
+        "transition_briefing_system",
+        language,
         company_profile=context["company_profile"],
         executive_summary=context["executive_summary"],
         business_case_summary=context["business_case_summary"],
@@ -466,10 +466,10 @@ def generate_swot_analysis(
 
     # Get the prompt template - use session language setting if available
     language = body.language or db_session.prompt_language or "en"
-    prompt_template = get_prompt("swot_analysis_system", language)
-
     # Fill in the template
-    filled_prompt = prompt_template.format(
+    filled_prompt = render_prompt(
+        "swot_analysis_system",
+        language,
         company_profile=context["company_profile"],
         executive_summary=context["executive_summary"],
         business_case_summary=context["business_case_summary"],
@@ -581,8 +581,9 @@ def _trigger_analysis_update_sync(
 
         # Regenerate SWOT Analysis
         try:
-            swot_prompt_template = get_prompt("swot_analysis_system", language)
-            swot_filled_prompt = swot_prompt_template.format(
+            swot_filled_prompt = render_prompt(
+                "swot_analysis_system",
+                language,
                 company_profile=context["company_profile"],
                 executive_summary=context["executive_summary"],
                 business_case_summary=context["business_case_summary"],
@@ -615,8 +616,9 @@ def _trigger_analysis_update_sync(
 
         # Regenerate Technical Briefing
         try:
-            briefing_prompt_template = get_prompt("transition_briefing_system", language)
-            briefing_filled_prompt = briefing_prompt_template.format(
+            briefing_filled_prompt = render_prompt(
+                "transition_briefing_system",
+                language,
                 company_profile=context["company_profile"],
                 executive_summary=context["executive_summary"],
                 business_case_summary=context["business_case_summary"],
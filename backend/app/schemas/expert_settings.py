@@ -190,7 +190,7 @@ PROMPT_METADATA = [
         key="consultation_context",
         label="Consultation Context Template",
         description="Session-specific context injected at start - company info, maturity, focus project, ideas",
-        variables=["company_name", "company_info_text", "maturity_section", "focus_idea", "top_ideas_text"]
+        variables=["company_name", "company_info_text", "maturity_section", "focus_idea", "top_ideas_text", "maturity_guidance_text"]
     ),
     PromptInfo(
         key="extraction_summary",
@@ -202,7 +202,7 @@ PROMPT_METADATA = [
         key="business_case_system",
         label="Business Case System Prompt",
         description="Guides the AI through business case development using the 5-level value framework",
-        variables=["company_info_text", "focus_idea", "business_objectives", "situation_assessment", "ai_goals", "project_plan"]
+        variables=["company_info_text", "focus_idea", "business_objectives", "situation_assessment", "ai_goals", "project_plan", "maturity_context", "technical_blockers"]
     ),
     PromptInfo(
         key="business_case_extraction",
@@ -214,7 +214,7 @@ PROMPT_METADATA = [
         key="cost_estimation_system",
         label="Cost Estimation System Prompt",
         description="Guides the AI through project cost estimation and budgeting",
-        variables=["company_info_text", "focus_idea", "business_objectives", "situation_assessment", "ai_goals", "project_plan", "potentials_summary"]
+        variables=["company_info_text", "focus_idea", "business_objectives", "situation_assessment", "ai_goals", "project_plan", "potentials_summary", "annual_benefit_eur"]
     ),
     PromptInfo(
         key="cost_estimation_extraction",
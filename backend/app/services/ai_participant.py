@@ -4,7 +4,7 @@ from typing import List, Optional, Dict
 from litellm import completion
 import logging
 
-from .default_prompts import get_prompt
+from .default_prompts import get_prompt, render_prompt
 from ..utils.llm import apply_model_params
 
 logger = logging.getLogger(__name__)
@@ -167,12 +167,12 @@ class AIParticipant:
 
     def _build_system_prompt(self, company_context: str, participant_number: int = 1, round_number: int = 1) -> str:
         """Build the system prompt with company context and participant-specific perspective."""
-        template = get_prompt(
+        base = render_prompt(
             "brainstorming_system",
             self.language,
-            self.custom_prompts
+            self.custom_prompts,
+            company_context=company_context
         )
-        base = template.format(company_context=company_context)
 
         # Round 1 only: inject a unique perspective per participant to seed diversity.
         # Subsequent rounds freely build on the rotating sheet (that's the 6-3-5 spirit).
@@ -222,12 +222,10 @@ class AIParticipant:
 
         if round_number == 1 or not previous_ideas:
             # First round - generate fresh ideas based on company context
-            template = get_prompt(
+            return render_prompt(
                 "brainstorming_round1",
                 self.language,
-                self.custom_prompts
-            )
-            return template.format(
+                self.custom_prompts,
                 round_number=round_number,
                 uniqueness_note=uniqueness_note
             )
@@ -235,12 +233,10 @@ class AIParticipant:
             # Subsequent rounds - read and build on previous ideas like a human would
             previous_ideas_numbered = "\n".join([f"  {i+1}. {idea}" for i, idea in enumerate(previous_ideas)])
 
-            template = get_prompt(
+            return render_prompt(
                 "brainstorming_subsequent",
                 self.language,
-                self.custom_prompts
-            )
-            return template.format(
+                self.custom_prompts,
                 round_number=round_number,
                 previous_ideas_numbered=previous_ideas_numbered,
                 uniqueness_note=uniqueness_note
@@ -413,7 +409,8 @@ Return the clustering as JSON."""
             "model": model,
             "messages": messages,
             "temperature": 0.3,  # Lower temperature for more consistent clustering
-            "max_tokens": max_tokens
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"}
         }
         if api_key:
             completion_kwargs["api_key"] = api_key
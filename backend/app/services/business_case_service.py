@@ -3,7 +3,7 @@
 from typing import List, Optional, Dict, Generator
 from sqlalchemy.orm import Session
 
-from ..utils.llm import LLMCaller, strip_think_tokens, extract_content, normalize_wiki_links
+from ..utils.llm import LLMCaller, strip_think_tokens, normalize_wiki_links, run_extraction
 from ..utils.security import validate_and_sanitize_message
 
 from ..models import (
@@ -16,7 +16,7 @@ from ..models import (
     Prioritization,
     MaturityAssessment,
 )
-from .default_prompts import get_prompt
+from .default_prompts import get_prompt, render_template
 from .company_profile_service import get_profile_as_context
 from ..utils.sse import format_sse_data, format_sse_error
 import logging
@@ -74,6 +74,30 @@ class BusinessCaseService:
             temperature = self.extraction_temperature
         return self._llm.call(messages, temperature, max_tokens, timeout=120)
 
+    # Sections the parser needs; if either is missing, the extraction is
+    # repeated with the worked examples appended to the prompt
+    _REQUIRED_EXTRACTION_SECTIONS = (
+        ("CLASSIFICATION", "KLASSIFIZIERUNG"),
+        ("BACK-OF-THE-ENVELOPE CALCULATION", "ÜBERSCHLAGSRECHNUNG"),
+    )
+
+    def _run_extraction(self, messages: List[Dict], session_uuid: str) -> str:
+        """Run the business case extraction prompt and return the raw summary.
+
+        See run_extraction for the retry with the worked examples.
+        """
+        summary, _ = run_extraction(
+            self._call_llm_extraction,
+            messages,
+            get_prompt("business_case_extraction", self.language, self.custom_prompts, with_examples=False),
+            get_prompt("business_case_extraction", self.language, self.custom_prompts),
+            self._REQUIRED_EXTRACTION_SECTIONS,
+            self._extract_section,
+            "business case",
+            session_uuid
+        )
+        return summary
+
     def start_business_case(self, session_uuid: str) -> Dict:
         """
         Start a new business case session.
@@ -492,19 +516,8 @@ class BusinessCaseService:
         db_session = self._get_session(session_uuid)
         messages = self._get_conversation_history(db_session.id)
 
-        # Get extraction prompt from templates
-        extraction_prompt = get_prompt(
-            "business_case_extraction",
-            self.language,
-            self.custom_prompts
-        )
-
-        messages.append({"role": "user", "content": extraction_prompt})
-
-        # Use higher max_tokens for potentially lengthy business case
-        response = self._call_llm_extraction(messages, max_tokens=6000)
-
-        summary = extract_content(response)
+        summary = self._run_extraction(messages, session_uuid)
+        findings: Dict[str, Optional[str]] = {}
 
         # Extract and save business case findings
         classification = (
@@ -526,7 +539,7 @@ class BusinessCaseService:
                 header_lines,
                 summary[:800] if summary else "(empty)"
             )
-        self._save_finding(db_session.id, "business_case_classification", normalize_wiki_links(classification) if classification else classification)
+        findings["business_case_classification"] = normalize_wiki_links(classification) if classification else classification
 
         calculation = (
             self._extract_section(summary, "BACK-OF-THE-ENVELOPE CALCULATION") or
@@ -556,13 +569,13 @@ class BusinessCaseService:
                 header_lines,
                 summary[:800] if summary else "(empty)"
             )
-        self._save_finding(db_session.id, "business_case_calculation", normalize_wiki_links(calculation) if calculation else calculation)
+        findings["business_case_calculation"] = normalize_wiki_links(calculation) if calculation else calculation
 
         validation = (
             self._extract_section(summary, "VALIDATION QUESTIONS") or
             self._extract_section(summary, "VALIDIERUNGSFRAGEN")
         )
-        self._save_finding(db_session.id, "business_case_validation", normalize_wiki_links(validation) if validation else validation)
+        findings["business_case_validation"] = normalize_wiki_links(validation) if validation else validation
 
         pitch = (
             self._extract_section(summary, "MANAGEMENT PITCH") or
@@ -576,25 +589,25 @@ class BusinessCaseService:
             self._extract_section(summary, "STRATEGIC PITCH") or
             self._extract_section(summary, "C-LEVEL PITCH")
         )
-        self._save_finding(db_session.id, "business_case_pitch", normalize_wiki_links(pitch) if pitch else pitch)
+        findings["business_case_pitch"] = normalize_wiki_links(pitch) if pitch else pitch
 
         assumptions = (
             self._extract_section(summary, "KEY ASSUMPTIONS") or
             self._extract_section(summary, "WICHTIGE ANNAHMEN")
         )
-        self._save_finding(db_session.id, "business_case_assumptions", normalize_wiki_links(assumptions) if assumptions else assumptions)
+        findings["business_case_assumptions"] = normalize_wiki_links(assumptions) if assumptions else assumptions
 
         viability = (
             self._extract_section(summary, "VIABILITY ASSESSMENT") or
             self._extract_section(summary, "WIRTSCHAFTLICHKEITSBEWERTUNG")
         )
-        self._save_finding(db_session.id, "business_case_viability", normalize_wiki_links(viability) if viability else viability)
+        findings["business_case_viability"] = normalize_wiki_links(viability) if viability else viability
 
         complexity_indicator = (
             self._extract_section(summary, "COMPLEXITY INDICATOR") or
             self._extract_section(summary, "KOMPLEXITÄTSINDIKATOR")
         )
-        self._save_finding(db_session.id, "business_case_complexity_indicator", normalize_wiki_links(complexity_indicator) if complexity_indicator else complexity_indicator)
+        findings["business_case_complexity_indicator"] = normalize_wiki_links(complexity_indicator) if complexity_indicator else complexity_indicator
 
         if not any([classification, calculation, validation, pitch]):
             logger.warning(
@@ -603,6 +616,7 @@ class BusinessCaseService:
                 session_uuid, summary[:500] if summary else "(empty)"
             )
 
+        self._save_findings(db_session.id, findings)
         self.db.commit()
 
         return {
@@ -794,7 +808,8 @@ class BusinessCaseService:
         )
 
         # Format with context variables
-        return template.format(
+        return render_template(
+            template,
             company_info_text=company_info_text,
             focus_idea=focus_idea,
             business_objectives=business_objectives,
@@ -817,28 +832,36 @@ class BusinessCaseService:
             for m in messages
         ]
 
-    def _save_finding(self, session_id: int, factor_type: str, text: str):
-        """Save or update a finding."""
-        if not text:
-            return
-        stripped = text.strip()
-        if not stripped or stripped.upper() in ("NULL", "N/A", "NONE", ""):
+    def _save_findings(self, session_id: int, findings: Dict[str, Optional[str]]):
+        """Save or update several findings, loading existing rows in one query.
+
+        Empty and placeholder texts (NULL, N/A, NONE) are skipped.
+        """
+        cleaned = {}
+        for factor_type, text in findings.items():
+            stripped = text.strip() if text else ""
+            if stripped and stripped.upper() not in ("NULL", "N/A", "NONE"):
+                cleaned[factor_type] = stripped
+        if not cleaned:
             return
-        text = stripped
 
-        existing = self.db.query(ConsultationFinding).filter(
-            ConsultationFinding.session_id == session_id,
-            ConsultationFinding.factor_type == factor_type
-        ).first()
+        existing = {
+            f.factor_type: f
+            for f in self.db.query(ConsultationFinding).filter(
+                ConsultationFinding.session_id == session_id,
+                ConsultationFinding.factor_type.in_(cleaned)
+            )
+        }
 
-        if existing:
-            existing.finding_text = text.strip()
-        else:
-            self.db.add(ConsultationFinding(
-                session_id=session_id,
-                factor_type=factor_type,
-                finding_text=text.strip()
-            ))
+        for factor_type, stripped in cleaned.items():
+            if factor_type in existing:
+                existing[factor_type].finding_text = stripped
+            else:
+                self.db.add(ConsultationFinding(
+                    session_id=session_id,
+                    factor_type=factor_type,
+                    finding_text=stripped
+                ))
 
     def _extract_section(self, text: str, section_name: str) -> Optional[str]:
         """Extract a section from formatted text.
@@ -10,6 +10,7 @@ from ..utils.llm import apply_model_params, extract_content
 from ..models import Session as SessionModel, CompanyInfo
 from ..schemas.company_profile import CompanyProfile, CompanyProfileResponse
 from ..utils.security import sanitize_user_input, validate_api_base
+from .default_prompts import render_template
 
 logger = logging.getLogger(__name__)
 
@@ -209,7 +210,7 @@ def extract_company_profile(
     lang = language if language in ["en", "de"] else "en"
     messages = [
         {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT[lang]},
-        {"role": "user", "content": EXTRACTION_USER_PROMPT[lang].format(raw_info=raw_info)}
+        {"role": "user", "content": render_template(EXTRACTION_USER_PROMPT[lang], raw_info=raw_info)}
     ]
 
     # Call LLM
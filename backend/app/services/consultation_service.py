@@ -19,7 +19,7 @@ from ..models import (
     Prioritization,
     MaturityAssessment
 )
-from .default_prompts import get_prompt
+from .default_prompts import get_prompt, render_template
 from .company_profile_service import get_profile_as_context
 from ..utils.sse import format_sse_data, format_sse_error
 
@@ -561,6 +561,7 @@ class ConsultationService:
         response = self._call_llm_extraction(messages, max_tokens=6000)
 
         summary = extract_content(response)
+        findings: Dict[str, Optional[str]] = {}
 
         # Save CRISP-DM Business Understanding findings
         # Extract company profile summary
@@ -568,7 +569,7 @@ class ConsultationService:
             self._extract_section(summary, "COMPANY PROFILE") or
             self._extract_section(summary, "UNTERNEHMENSPROFIL")
         )
-        self._save_finding(db_session.id, "company_profile", normalize_wiki_links(company_profile) if company_profile else company_profile)
+        findings["company_profile"] = normalize_wiki_links(company_profile) if company_profile else company_profile
 
         # Try new format first, fall back to old format for compatibility
         business_obj = (
@@ -576,7 +577,7 @@ class ConsultationService:
             self._extract_section(summary, "GESCHÄFTSZIELE") or
             self._extract_section(summary, "PROJECT RECOMMENDATION")
         )
-        self._save_finding(db_session.id, "business_objectives", normalize_wiki_links(business_obj) if business_obj else business_obj)
+        findings["business_objectives"] = normalize_wiki_links(business_obj) if business_obj else business_obj
 
         situation = (
             self._extract_section(summary, "SITUATION ASSESSMENT") or
@@ -588,7 +589,7 @@ class ConsultationService:
             self._extract_section(summary, "IST-ANALYSE") or
             self._extract_section(summary, "AUSGANGSSITUATION")
         )
-        self._save_finding(db_session.id, "situation_assessment", normalize_wiki_links(situation) if situation else situation)
+        findings["situation_assessment"] = normalize_wiki_links(situation) if situation else situation
 
         ai_goals = (
             self._extract_section(summary, "AI/DATA MINING GOALS") or
@@ -599,7 +600,7 @@ class ConsultationService:
             self._extract_section(summary, "AI GOALS") or
             self._extract_section(summary, "BUSINESS CASE")
         )
-        self._save_finding(db_session.id, "ai_goals", normalize_wiki_links(ai_goals) if ai_goals else ai_goals)
+        findings["ai_goals"] = normalize_wiki_links(ai_goals) if ai_goals else ai_goals
 
         project_plan = (
             self._extract_section(summary, "PROJECT PLAN") or
@@ -610,7 +611,7 @@ class ConsultationService:
             self._extract_section(summary, "PILOTPLAN") or
             self._extract_section(summary, "PROJEKTSCHRITTE")
         )
-        self._save_finding(db_session.id, "project_plan", normalize_wiki_links(project_plan) if project_plan else project_plan)
+        findings["project_plan"] = normalize_wiki_links(project_plan) if project_plan else project_plan
 
         open_risks = (
             self._extract_section(summary, "OPEN RISKS / BLOCKERS") or
@@ -618,7 +619,7 @@ class ConsultationService:
             self._extract_section(summary, "OFFENE RISIKEN / BLOCKER") or
             self._extract_section(summary, "OFFENE RISIKEN")
         )
-        self._save_finding(db_session.id, "open_risks", normalize_wiki_links(open_risks) if open_risks else open_risks)
+        findings["open_risks"] = normalize_wiki_links(open_risks) if open_risks else open_risks
 
         if not any([company_profile, business_obj, situation, ai_goals, project_plan]):
             logger.warning(
@@ -627,6 +628,7 @@ class ConsultationService:
                 session_uuid, summary[:500] if summary else "(empty)"
             )
 
+        self._save_findings(db_session.id, findings)
         self.db.commit()
 
         return {
@@ -693,22 +695,13 @@ Respond only with these 4 categories, brief and concise."""
                             return value
                 return None
 
-            # Extract and save each finding
-            business_obj = extract_value(content, "BUSINESS_OBJECTIVES") or extract_value(content, "GESCHÄFTSZIELE")
-            if business_obj:
-                self._save_finding(db_session.id, "business_objectives", business_obj)
-
-            situation = extract_value(content, "SITUATION")
-            if situation:
-                self._save_finding(db_session.id, "situation_assessment", situation)
-
-            ai_goals = extract_value(content, "AI_GOALS") or extract_value(content, "KI-ZIELE")
-            if ai_goals:
-                self._save_finding(db_session.id, "ai_goals", ai_goals)
-
-            project_plan = extract_value(content, "PROJECT_PLAN") or extract_value(content, "PROJEKTPLAN")
-            if project_plan:
-                self._save_finding(db_session.id, "project_plan", project_plan)
+            # Extract and save each finding (empty values are skipped)
+            self._save_findings(db_session.id, {
+                "business_objectives": extract_value(content, "BUSINESS_OBJECTIVES") or extract_value(content, "GESCHÄFTSZIELE"),
+                "situation_assessment": extract_value(content, "SITUATION"),
+                "ai_goals": extract_value(content, "AI_GOALS") or extract_value(content, "KI-ZIELE"),
+                "project_plan": extract_value(content, "PROJECT_PLAN") or extract_value(content, "PROJEKTPLAN"),
+            })
 
             self.db.commit()
 
@@ -835,7 +828,7 @@ When multiple people contribute:
             self.custom_prompts
         )
 
-        return template.format(multi_participant_section=multi_participant_section)
+        return render_template(template, multi_participant_section=multi_participant_section)
 
     def _build_context_message(self, context: Dict) -> str:
         """Build the context message with session-specific data."""
@@ -920,7 +913,8 @@ When multiple people contribute:
                 else:
                     maturity_guidance_text = f"**Guidance for Level {level_int} — {level_name}:** {guidance_text}"
 
-        return template.format(
+        return render_template(
+            template,
             company_name=context.get('company_name', 'Unknown'),
             company_info_text=company_info_text,
             maturity_section=maturity_section,
@@ -1108,28 +1102,36 @@ When multiple people contribute:
 
         return header + "\n\n".join(lines) + "\n\n---\n\n"
 
-    def _save_finding(self, session_id: int, factor_type: str, text: str):
-        """Save or update a finding."""
-        if not text:
-            return
-        stripped = text.strip()
-        if not stripped or stripped.upper() in ("NULL", "N/A", "NONE", ""):
+    def _save_findings(self, session_id: int, findings: Dict[str, Optional[str]]):
+        """Save or update several findings, loading existing rows in one query.
+
+        Empty and placeholder texts (NULL, N/A, NONE) are skipped.
+        """
+        cleaned = {}
+        for factor_type, text in findings.items():
+            stripped = text.strip() if text else ""
+            if stripped and stripped.upper() not in ("NULL", "N/A", "NONE"):
+                cleaned[factor_type] = stripped
+        if not cleaned:
             return
-        text = stripped
 
-        existing = self.db.query(ConsultationFinding).filter(
-            ConsultationFinding.session_id == session_id,
-            ConsultationFinding.factor_type == factor_type
-        ).first()
+        existing = {
+            f.factor_type: f
+            for f in self.db.query(ConsultationFinding).filter(
+                ConsultationFinding.session_id == session_id,
+                ConsultationFinding.factor_type.in_(cleaned)
+            )
+        }
 
-        if existing:
-            existing.finding_text = text.strip()
-        else:
-            self.db.add(ConsultationFinding(
-                session_id=session_id,
-                factor_type=factor_type,
-                finding_text=text.strip()
-            ))
+        for factor_type, stripped in cleaned.items():
+            if factor_type in existing:
+                existing[factor_type].finding_text = stripped
+            else:
+                self.db.add(ConsultationFinding(
+                    session_id=session_id,
+                    factor_type=factor_type,
+                    finding_text=stripped
+                ))
 
     def _extract_section(self, text: str, section_name: str) -> Optional[str]:
         """Extract a section from formatted text.
@@ -1,11 +1,15 @@
 """Service for AI-powered cost estimation in Step 5b using LiteLLM (multi-provider)."""
 
 import re
-from typing import List, Optional, Dict, Generator, Tuple
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Dict, Generator, Iterator, Tuple
 from sqlalchemy.orm import Session
 import logging
 
-from ..utils.llm import LLMCaller, strip_think_tokens, extract_content, normalize_wiki_links
+from ..utils.llm import LLMCaller, strip_think_tokens, normalize_wiki_links, run_extraction
 from ..utils.security import validate_and_sanitize_message
 
 logger = logging.getLogger(__name__)
@@ -19,10 +23,149 @@ from ..models import (
     IdeaSheet,
     Prioritization
 )
-from .default_prompts import get_prompt
+from .default_prompts import get_prompt, render_template
 from .company_profile_service import get_profile_as_context
 from ..utils.sse import format_sse_data, format_sse_error
 
+# Per-session start locks. Two tabs starting the same session at once would
+# otherwise both pass the "already started" check and insert duplicate
+# rows and bill the LLM twice; the second caller waits for the first one
+# and replays its response instead. Each entry is [lock, number of users]
+# and is dropped when its last user is done, so the dict stays bounded by
+# the number of starts in flight.
+_START_LOCKS: Dict[str, list] = {}
+_START_LOCKS_GUARD = threading.Lock()
+_START_WAIT_SECONDS = 60
+
+# Markdown/bold header lines, used only for the "section missing" diagnostic.
+_HEADER_LINE_RE = re.compile(r'^[ \t]*((?:#|\*\*)[^\n]*?)[ \t\r]*$', re.MULTILINE)
+
+# Euro amount / ROI table parsing
+_EUR_CLEAN_RE = re.compile(r'[*_€\s]')
+_EUR_NUM_RE = re.compile(r'[\d][,\.\d]*')
+_THOUSANDS_RE = re.compile(r'[,\.](?=\d{3}(?:[^\d]|$))')
+_ROI_PCT_RE = re.compile(r'(-?[\d][,\.\d]*)\s*%')
+_PAYBACK_YEAR_RE = re.compile(r'(\d+\.?\d*)\s*year', re.IGNORECASE)
+
+# ROI table rows: result field -> lowercase keywords identifying the row.
+# A row mentioning both "roi" and "3" also counts as the 3-year ROI row.
+_ROI_ROW_KEYWORDS = {
+    'annual_recurring': ('annual recurring', 'recurring costs', 'laufende kosten'),
+    'initial_investment': ('initial investment', 'erstinvestition'),
+    'payback_years': ('payback', 'amortisation'),
+    'roi_percent': ('3-year roi', '3-jahres-roi'),
+}
+_ROI_KEYWORD_FIELDS = {kw: field for field, kws in _ROI_ROW_KEYWORDS.items() for kw in kws}
+_ROI_KEYWORD_RE = re.compile('|'.join(
+    re.escape(kw) for kw in sorted(_ROI_KEYWORD_FIELDS, key=len, reverse=True)
+))
+
+# Moderate annual benefit figure in the Step 5a calculation, most specific first
+_STEP5A_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Total Annual Benefit[^€\n]*€\s*([\d][,\.\d]*(?:[kKmM])?)',
+    r'Gesamter Jahresnutzen[^€\n]*€\s*([\d][,\.\d]*(?:[kKmM])?)',
+    r'Annual Benefit[^€\n]*moderate[^€\n]*€\s*([\d][,\.\d]*(?:[kKmM])?)',
+    r'Jahresnutzen[^€\n]*moderat[^€\n]*€\s*([\d][,\.\d]*(?:[kKmM])?)',
+))
+
+def _normalize_num_str(num: str) -> float:
+    """Convert a matched digit span (e.g. '1.000,50') to a float.
+
+    Raises ValueError when the span is not a valid number.
+    """
+    # Remove thousand separators (comma/dot followed by exactly 3 digits)
+    if len(num) > 4:
+        num = _THOUSANDS_RE.sub('', num)
+    return float(num.replace(',', '.'))  # normalise remaining decimal separator
+
+
+def _format_eur(value: float, language: str) -> str:
+    """Format a euro amount for the prompt language without using locale.
+
+    EN: €119,000 / €2.40M; DE: €119.000 / €2,40 Mio.
+    """
+    if value >= 1_000_000:
+        if language == "de":
+            return f"€{value / 1_000_000:.2f} Mio.".replace(".", ",", 1)
+        return f"€{value / 1_000_000:.2f}M"
+    display = f"€{value:,.0f}"
+    return display.replace(",", ".") if language == "de" else display
+
+
+# Section header normalization: Unicode dashes (U+2010–U+2015, U+2212) map to
+# an ASCII hyphen, and wiki-link wrappers [[id|Display Text]] to Display Text
+_DASH_TRANS = str.maketrans({c: '-' for c in '\u2010\u2011\u2012\u2013\u2014\u2015\u2212'})
+_WIKI_HEADER_RE = re.compile(r'\[\[[^\]|]*\|([^\]]+)\]\]')
+
+
+def _normalize_header(s: str) -> str:
+    """Normalize dashes and wiki-link wrappers before header matching."""
+    s = s.translate(_DASH_TRANS)
+    if '[[' in s:
+        s = _WIKI_HEADER_RE.sub(r'\1', s)  # [[id|Text]] → Text
+    return s
+
+
+@lru_cache(maxsize=128)
+def _section_header_patterns(esc: str) -> Tuple[Tuple[re.Pattern, bool], ...]:
+    """Compile the header patterns for an escaped, normalized section name.
+
+    Returns (pattern, captures_hash_level) pairs; the first pattern captures
+    the leading #+ as group(1) to detect the header level.
+    """
+    return tuple((re.compile(p, re.IGNORECASE), captures_level) for p, captures_level in (
+        (rf'^(#{{2,6}})\s*\*{{0,2}}(?:\d+\.\s*)?{esc}\*{{0,2}}[^\n]*$', True),   # ## to ###### SECTION
+        (rf'^\*\*#{{1,3}}\s*(?:\d+\.\s*)?{esc}[^\n]*$', False),                    # **## SECTION (bold wraps hash)
+        (rf'^\*\*(?:\d+\.\s*)?{esc}\*\*[:\s]*$', False),                           # **SECTION**: (colon outside bold)
+        (rf'^\*\*(?:\d+\.\s*)?{esc}:\*\*\s*$', False),                             # **SECTION:** (colon inside bold)
+        (rf'^(?:\d+\.\s*)?{esc}[:\s]*$', False),                                   # SECTION: (plain)
+    ))
+
+
+@lru_cache(maxsize=8)
+def _next_section_re(start_level: int) -> re.Pattern:
+    """Compile the pattern for headers that end a section at start_level.
+
+    Level-aware end detection: only stop at headers with depth ≤ start_level.
+    Bold is only a header if ALL-CAPS (no lowercase in bold text — avoids
+    matching inline labels).
+    """
+    return re.compile(
+        rf'^('
+        rf'#{{2,{start_level}}}\s+\*{{0,2}}(?:\d+\.\s*)?[A-Z]'     # ## .. start_level headers
+        rf'|\*\*#{{1,3}}\s+(?:\d+\.\s*)?[A-Z]'                     # **## SECTION (bold wraps hash)
+        rf'|\*\*(?:\d+\.\s*)?[A-Z][^a-z*\n]*\*\*\s*:?\s*$'        # **ALL CAPS** (no lowercase)
+        rf'|[A-Z]{{3,}}[A-Z\s\-()]*[:\s]*$'                        # PLAIN ALLCAPS
+        rf')'
+    )
+
+
+def _section_lines(text: str) -> Tuple[List[str], List[str]]:
+    """Split text for _extract_section into raw lines and normalized header candidates."""
+    lines = text.splitlines()
+    return lines, [_normalize_header(line.strip()) for line in lines]
+
+
+@contextmanager
+def _start_lock(key: str) -> Iterator[threading.Lock]:
+    """Yield the process-wide lock for a session start key.
+
+    The caller acquires and releases the lock itself; the registry entry is
+    removed once no caller is using it any more.
+    """
+    with _START_LOCKS_GUARD:
+        entry = _START_LOCKS.get(key)
+        if entry is None:
+            entry = _START_LOCKS[key] = [threading.Lock(), 0]
+        entry[1] += 1
+    try:
+        yield entry[0]
+    finally:
+        with _START_LOCKS_GUARD:
+            entry[1] -= 1
+            if not entry[1]:
+                del _START_LOCKS[key]
+
 
 class CostEstimationService:
     """AI cost estimation consultant service using LiteLLM for Step 5b."""
@@ -74,11 +217,50 @@ class CostEstimationService:
             temperature = self.extraction_temperature
         return self._llm.call(messages, temperature, max_tokens, timeout=120)
 
+    # Sections the parser needs; if either is missing, the extraction is
+    # repeated with the worked examples appended to the prompt
+    _REQUIRED_EXTRACTION_SECTIONS = (
+        ("COMPLEXITY ASSESSMENT", "KOMPLEXITÄTSBEWERTUNG"),
+        ("INVESTMENT VS. RETURN", "INVESTITION VS. RENDITE"),
+    )
+
+    def _run_extraction(
+        self, messages: List[Dict], session_uuid: str
+    ) -> Tuple[str, Tuple[List[str], List[str]]]:
+        """Run the cost estimation extraction prompt.
+
+        See run_extraction for the retry with the worked examples.
+
+        Returns the raw summary and its _section_lines for _extract_section.
+        """
+        summary, (_, lines) = run_extraction(
+            self._call_llm_extraction,
+            messages,
+            get_prompt("cost_estimation_extraction", self.language, self.custom_prompts, with_examples=False),
+            get_prompt("cost_estimation_extraction", self.language, self.custom_prompts),
+            self._REQUIRED_EXTRACTION_SECTIONS,
+            lambda parsed, name: self._extract_section(parsed[0], name, parsed[1]),
+            "cost estimation",
+            session_uuid,
+            parse=lambda summary: (summary, _section_lines(summary))
+        )
+        return summary, lines
+
     def start_cost_estimation(self, session_uuid: str) -> Dict:
         """
         Start a new cost estimation session.
         Creates the initial system message and first AI response.
         """
+        with _start_lock(f"{session_uuid}:{self.MESSAGE_TYPE}") as lock:
+            if not lock.acquire(timeout=_START_WAIT_SECONDS):
+                raise TimeoutError("Cost estimation is already being started for this session")
+            try:
+                return self._start_cost_estimation(session_uuid)
+            finally:
+                lock.release()
+
+    def _start_cost_estimation(self, session_uuid: str) -> Dict:
+        """Body of start_cost_estimation; caller holds the session start lock."""
         db_session = self._get_session(session_uuid)
 
         # Check if cost estimation already started
@@ -140,7 +322,46 @@ class CostEstimationService:
         """
         Start cost estimation with streaming response.
         Yields chunks of the AI response as they arrive.
+
+        Concurrent starts for the same session are coalesced: only the first
+        caller talks to the LLM, later callers wait and receive its response.
         """
+        with _start_lock(f"{session_uuid}:{self.MESSAGE_TYPE}") as lock:
+            if not lock.acquire(blocking=False):
+                yield from self._replay_concurrent_start(session_uuid, lock)
+                return
+            try:
+                yield from self._start_cost_estimation_stream(session_uuid)
+            finally:
+                lock.release()
+
+    def _replay_concurrent_start(
+        self, session_uuid: str, lock: threading.Lock
+    ) -> Generator[str, None, None]:
+        """Wait for an in-flight start and stream back its first AI response."""
+        if not lock.acquire(timeout=_START_WAIT_SECONDS):
+            yield format_sse_error("Cost estimation is already being started for this session", "timeout")
+            return
+        lock.release()
+
+        self.db.expire_all()
+        db_session = self._get_session(session_uuid)
+        first_reply = self.db.query(ConsultationMessage).filter(
+            ConsultationMessage.session_id == db_session.id,
+            ConsultationMessage.message_type == self.MESSAGE_TYPE,
+            ConsultationMessage.role == "assistant"
+        ).order_by(ConsultationMessage.created_at).first()
+
+        if not first_reply:
+            # The in-flight start failed before it could store a response
+            yield format_sse_error("Cost estimation start did not complete", "error")
+            return
+
+        yield format_sse_data(first_reply.content)
+        yield "data: [DONE]\n\n"
+
+    def _start_cost_estimation_stream(self, session_uuid: str) -> Generator[str, None, None]:
+        """Body of start_cost_estimation_stream; caller holds the session start lock."""
         db_session = self._get_session(session_uuid)
 
         # Check if cost estimation already started
@@ -182,24 +403,24 @@ class CostEstimationService:
         ]
 
         # Stream the response with error handling
-        full_response = ""
+        chunks: List[str] = []
         try:
             stream = self._call_llm_stream(messages, temperature=0.7, max_tokens=1500)
 
             for chunk in stream:
                 if chunk.choices[0].delta.content:
                     content = strip_think_tokens(chunk.choices[0].delta.content)
-                    full_response += content
+                    chunks.append(content)
                     yield format_sse_data(content)
 
         except (ConnectionError, TimeoutError) as e:
             logger.warning(f"Stream connection error (recoverable): {e}")
             yield format_sse_error(f"Connection interrupted: {str(e)}", "connection_error")
-            if full_response:
+            if chunks:
                 ai_msg = ConsultationMessage(
                     session_id=db_session.id,
                     role="assistant",
-                    content=full_response + "\n\n[Response interrupted due to connection error]",
+                    content="".join(chunks) + "\n\n[Response interrupted due to connection error]",
                     message_type=self.MESSAGE_TYPE
                 )
                 self.db.add(ai_msg)
@@ -215,7 +436,7 @@ class CostEstimationService:
         ai_msg = ConsultationMessage(
             session_id=db_session.id,
             role="assistant",
-            content=full_response,
+            content="".join(chunks),
             message_type=self.MESSAGE_TYPE
         )
         self.db.add(ai_msg)
@@ -322,24 +543,24 @@ class CostEstimationService:
         messages = self._get_conversation_history(db_session.id)
 
         # Stream the response with error handling
-        full_response = ""
+        chunks: List[str] = []
         try:
             stream = self._call_llm_stream(messages, temperature=0.7, max_tokens=1500)
 
             for chunk in stream:
                 if chunk.choices[0].delta.content:
                     content = strip_think_tokens(chunk.choices[0].delta.content)
-                    full_response += content
+                    chunks.append(content)
                     yield format_sse_data(content)
 
         except (ConnectionError, TimeoutError) as e:
             logger.warning(f"Stream connection error (recoverable): {e}")
             yield format_sse_error(f"Connection interrupted: {str(e)}", "connection_error")
-            if full_response:
+            if chunks:
                 ai_msg = ConsultationMessage(
                     session_id=db_session.id,
                     role="assistant",
-                    content=full_response + "\n\n[Response interrupted due to connection error]",
+                    content="".join(chunks) + "\n\n[Response interrupted due to connection error]",
                     message_type=self.MESSAGE_TYPE
                 )
                 self.db.add(ai_msg)
@@ -355,7 +576,7 @@ class CostEstimationService:
         ai_msg = ConsultationMessage(
             session_id=db_session.id,
             role="assistant",
-            content=full_response,
+            content="".join(chunks),
             message_type=self.MESSAGE_TYPE
         )
         self.db.add(ai_msg)
@@ -380,24 +601,24 @@ class CostEstimationService:
             return
 
         # Stream the response with error handling
-        full_response = ""
+        chunks: List[str] = []
         try:
             stream = self._call_llm_stream(messages, temperature=0.7, max_tokens=1500)
 
             for chunk in stream:
                 if chunk.choices[0].delta.content:
                     content = strip_think_tokens(chunk.choices[0].delta.content)
-                    full_response += content
+                    chunks.append(content)
                     yield format_sse_data(content)
 
         except (ConnectionError, TimeoutError) as e:
             logger.warning(f"Stream connection error (recoverable): {e}")
             yield format_sse_error(f"Connection interrupted: {str(e)}", "connection_error")
-            if full_response:
+            if chunks:
                 ai_msg = ConsultationMessage(
                     session_id=db_session.id,
                     role="assistant",
-                    content=full_response + "\n\n[Response interrupted due to connection error]",
+                    content="".join(chunks) + "\n\n[Response interrupted due to connection error]",
                     message_type=self.MESSAGE_TYPE
                 )
                 self.db.add(ai_msg)
@@ -413,7 +634,7 @@ class CostEstimationService:
         ai_msg = ConsultationMessage(
             session_id=db_session.id,
             role="assistant",
-            content=full_response,
+            content="".join(chunks),
             message_type=self.MESSAGE_TYPE
         )
         self.db.add(ai_msg)
@@ -495,33 +716,21 @@ class CostEstimationService:
         db_session = self._get_session(session_uuid)
         messages = self._get_conversation_history(db_session.id)
 
-        # Get extraction prompt from templates
-        extraction_prompt = get_prompt(
-            "cost_estimation_extraction",
-            self.language,
-            self.custom_prompts
-        )
-
-        messages.append({"role": "user", "content": extraction_prompt})
-
-        # Use higher max_tokens for potentially lengthy cost breakdown
-        response = self._call_llm_extraction(messages, max_tokens=6000)
-
-        summary = extract_content(response)
+        summary, lines = self._run_extraction(messages, session_uuid)
+        findings: Dict[str, Optional[str]] = {}
 
         # Extract and save cost estimation findings
         complexity = (
-            self._extract_section(summary, "COMPLEXITY ASSESSMENT") or
-            self._extract_section(summary, "KOMPLEXITÄTSBEWERTUNG") or
-            self._extract_section(summary, "COMPLEXITY") or
-            self._extract_section(summary, "KOMPLEXITÄT") or
-            self._extract_section(summary, "PROJEKTKOMPLEXITÄT")
+            self._extract_section(summary, "COMPLEXITY ASSESSMENT", lines) or
+            self._extract_section(summary, "KOMPLEXITÄTSBEWERTUNG", lines) or
+            self._extract_section(summary, "COMPLEXITY", lines) or
+            self._extract_section(summary, "KOMPLEXITÄT", lines) or
+            self._extract_section(summary, "PROJEKTKOMPLEXITÄT", lines)
         )
         if not complexity:
             header_lines = [
-                l.strip() for l in summary.split('\n')
-                if l.strip().startswith('#') or l.strip().startswith('**')
-            ][:20]
+                m.group(1) for m in islice(_HEADER_LINE_RE.finditer(summary), 20)
+            ]
             logger.warning(
                 "Cost estimation COMPLEXITY section missing for session %s. "
                 "Headers found: %s | First 800 chars: %s",
@@ -529,54 +738,54 @@ class CostEstimationService:
                 header_lines,
                 summary[:800] if summary else "(empty)"
             )
-        self._save_finding(db_session.id, "cost_complexity", normalize_wiki_links(complexity) if complexity else complexity)
+        findings["cost_complexity"] = normalize_wiki_links(complexity) if complexity else complexity
 
         initial = (
-            self._extract_section(summary, "INITIAL INVESTMENT") or
-            self._extract_section(summary, "ERSTINVESTITION")
+            self._extract_section(summary, "INITIAL INVESTMENT", lines) or
+            self._extract_section(summary, "ERSTINVESTITION", lines)
         )
-        self._save_finding(db_session.id, "cost_initial", normalize_wiki_links(initial) if initial else initial)
+        findings["cost_initial"] = normalize_wiki_links(initial) if initial else initial
 
         recurring = (
-            self._extract_section(summary, "RECURRING COSTS") or
-            self._extract_section(summary, "LAUFENDE KOSTEN")
+            self._extract_section(summary, "RECURRING COSTS", lines) or
+            self._extract_section(summary, "LAUFENDE KOSTEN", lines)
         )
-        self._save_finding(db_session.id, "cost_recurring", normalize_wiki_links(recurring) if recurring else recurring)
+        findings["cost_recurring"] = normalize_wiki_links(recurring) if recurring else recurring
 
         maintenance = (
-            self._extract_section(summary, "MAINTENANCE") or
-            self._extract_section(summary, "WARTUNG")
+            self._extract_section(summary, "MAINTENANCE", lines) or
+            self._extract_section(summary, "WARTUNG", lines)
         )
-        self._save_finding(db_session.id, "cost_maintenance", normalize_wiki_links(maintenance) if maintenance else maintenance)
+        findings["cost_maintenance"] = normalize_wiki_links(maintenance) if maintenance else maintenance
 
         tco = (
-            self._extract_section(summary, "3-YEAR TOTAL COST OF OWNERSHIP") or
-            self._extract_section(summary, "3-YEAR TCO") or
-            self._extract_section(summary, "TOTAL COST OF OWNERSHIP") or
-            self._extract_section(summary, "3-JAHRES-GESAMTBETRIEBSKOSTEN") or
-            self._extract_section(summary, "3-JAHRES GESAMTBETRIEBSKOSTEN") or   # space instead of hyphen
-            self._extract_section(summary, "GESAMTBETRIEBSKOSTEN") or
-            self._extract_section(summary, "TCO")
+            self._extract_section(summary, "3-YEAR TOTAL COST OF OWNERSHIP", lines) or
+            self._extract_section(summary, "3-YEAR TCO", lines) or
+            self._extract_section(summary, "TOTAL COST OF OWNERSHIP", lines) or
+            self._extract_section(summary, "3-JAHRES-GESAMTBETRIEBSKOSTEN", lines) or
+            self._extract_section(summary, "3-JAHRES GESAMTBETRIEBSKOSTEN", lines) or   # space instead of hyphen
+            self._extract_section(summary, "GESAMTBETRIEBSKOSTEN", lines) or
+            self._extract_section(summary, "TCO", lines)
         )
-        self._save_finding(db_session.id, "cost_tco", normalize_wiki_links(tco) if tco else tco)
+        findings["cost_tco"] = normalize_wiki_links(tco) if tco else tco
 
         drivers = (
-            self._extract_section(summary, "COST DRIVERS") or
-            self._extract_section(summary, "KOSTENTREIBER")
+            self._extract_section(summary, "COST DRIVERS", lines) or
+            self._extract_section(summary, "KOSTENTREIBER", lines)
         )
-        self._save_finding(db_session.id, "cost_drivers", normalize_wiki_links(drivers) if drivers else drivers)
+        findings["cost_drivers"] = normalize_wiki_links(drivers) if drivers else drivers
 
         optimization = (
-            self._extract_section(summary, "COST OPTIMIZATION OPTIONS") or
-            self._extract_section(summary, "KOSTENOPTIMIERUNGSOPTIONEN")
+            self._extract_section(summary, "COST OPTIMIZATION OPTIONS", lines) or
+            self._extract_section(summary, "KOSTENOPTIMIERUNGSOPTIONEN", lines)
         )
-        self._save_finding(db_session.id, "cost_optimization", normalize_wiki_links(optimization) if optimization else optimization)
+        findings["cost_optimization"] = normalize_wiki_links(optimization) if optimization else optimization
 
         roi = (
-            self._extract_section(summary, "INVESTMENT VS. RETURN") or
-            self._extract_section(summary, "INVESTITION VS. RENDITE")
+            self._extract_section(summary, "INVESTMENT VS. RETURN", lines) or
+            self._extract_section(summary, "INVESTITION VS. RENDITE", lines)
         )
-        self._save_finding(db_session.id, "cost_roi", normalize_wiki_links(roi) if roi else roi)
+        findings["cost_roi"] = normalize_wiki_links(roi) if roi else roi
 
         if not any([complexity, initial, recurring, tco, roi]):
             logger.warning(
@@ -585,6 +794,7 @@ class CostEstimationService:
                 session_uuid, summary[:500] if summary else "(empty)"
             )
 
+        self._save_findings(db_session.id, findings)
         self.db.commit()
 
         # Re-extract the Step 5a annual benefit and validate ROI arithmetic.
@@ -774,7 +984,8 @@ class CostEstimationService:
         )
 
         # Format with context variables
-        return template.format(
+        return render_template(
+            template,
             company_info_text=company_info_text,
             focus_idea=focus_idea,
             business_objectives=business_objectives,
@@ -797,28 +1008,36 @@ class CostEstimationService:
             for m in messages
         ]
 
-    def _save_finding(self, session_id: int, factor_type: str, text: str):
-        """Save or update a finding."""
-        if not text:
-            return
-        stripped = text.strip()
-        if not stripped or stripped.upper() in ("NULL", "N/A", "NONE", ""):
+    def _save_findings(self, session_id: int, findings: Dict[str, Optional[str]]):
+        """Save or update several findings, loading existing rows in one query.
+
+        Empty and placeholder texts (NULL, N/A, NONE) are skipped.
+        """
+        cleaned = {}
+        for factor_type, text in findings.items():
+            stripped = text.strip() if text else ""
+            if stripped and stripped.upper() not in ("NULL", "N/A", "NONE"):
+                cleaned[factor_type] = stripped
+        if not cleaned:
             return
-        text = stripped
 
-        existing = self.db.query(ConsultationFinding).filter(
-            ConsultationFinding.session_id == session_id,
-            ConsultationFinding.factor_type == factor_type
-        ).first()
+        existing = {
+            f.factor_type: f
+            for f in self.db.query(ConsultationFinding).filter(
+                ConsultationFinding.session_id == session_id,
+                ConsultationFinding.factor_type.in_(cleaned)
+            )
+        }
 
-        if existing:
-            existing.finding_text = text.strip()
-        else:
-            self.db.add(ConsultationFinding(
-                session_id=session_id,
-                factor_type=factor_type,
-                finding_text=text.strip()
-            ))
+        for factor_type, stripped in cleaned.items():
+            if factor_type in existing:
+                existing[factor_type].finding_text = stripped
+            else:
+                self.db.add(ConsultationFinding(
+                    session_id=session_id,
+                    factor_type=factor_type,
+                    finding_text=stripped
+                ))
 
     # ------------------------------------------------------------------
     # Benefit extraction & ROI validation helpers
@@ -832,7 +1051,7 @@ class CostEstimationService:
         """
         if not text:
             return None
-        clean = re.sub(r'[*_€\s]', '', text)
+        clean = _EUR_CLEAN_RE.sub('', text)
         negative = clean.startswith('−') or clean.startswith('-')
         clean = clean.lstrip('−-')
         multiplier = 1
@@ -842,15 +1061,11 @@ class CostEstimationService:
         elif clean.lower().endswith('m'):
             multiplier = 1_000_000
             clean = clean[:-1]
-        m = re.search(r'[\d][,\.\d]*', clean)
+        m = _EUR_NUM_RE.search(clean)
         if not m:
             return None
-        num = m.group()
-        # Remove thousand separators (comma/dot followed by exactly 3 digits)
-        num = re.sub(r'[,\.](?=\d{3}(?:[^\d]|$))', '', num)
-        num = num.replace(',', '.')  # normalise remaining decimal separator
         try:
-            value = float(num) * multiplier
+            value = _normalize_num_str(m.group()) * multiplier
             return -value if negative else value
         except ValueError:
             return None
@@ -868,66 +1083,61 @@ class CostEstimationService:
         if not calculation:
             return None, "Not available — Step 5a not yet completed."
 
-        patterns = [
-            r'Total Annual Benefit[^€\n]*€\s*([\d][,\.\d]*(?:[kKmM])?)',
-            r'Gesamter Jahresnutzen[^€\n]*€\s*([\d][,\.\d]*(?:[kKmM])?)',
-            r'Annual Benefit[^€\n]*moderate[^€\n]*€\s*([\d][,\.\d]*(?:[kKmM])?)',
-            r'Jahresnutzen[^€\n]*moderat[^€\n]*€\s*([\d][,\.\d]*(?:[kKmM])?)',
-        ]
-        for pattern in patterns:
-            m = re.search(pattern, calculation, re.IGNORECASE)
+        for pattern in _STEP5A_PATTERNS:
+            m = pattern.search(calculation)
             if m:
                 value = self._parse_eur_value(m.group(1))
                 if value and value > 0:
-                    if value >= 1_000_000:
-                        display = f"€{value / 1_000_000:.2f}M"
-                    else:
-                        display = f"€{value:,.0f}"
-                    return value, display
+                    return value, _format_eur(value, self.language)
 
         return None, "Not extracted — see calculation above."
 
-    def _parse_roi_table_value(self, roi_text: str, keywords: list) -> Optional[float]:
-        """Find a row in the ROI markdown table by keywords and return its euro value."""
-        for line in roi_text.split('\n'):
-            if '|' not in line:
-                continue
-            lower = line.lower()
-            if any(kw in lower for kw in keywords):
-                cols = [c.strip() for c in line.split('|')]
-                for col in reversed(cols):
-                    if col and col not in ('', '-', '—'):
-                        val = self._parse_eur_value(col)
-                        if val is not None:
-                            return val
-        return None
+    def _parse_roi_table(self, roi_text: str) -> Dict[str, Optional[float]]:
+        """Parse the ROI markdown table in a single pass.
+
+        Returns a dict with the keys of _ROI_ROW_KEYWORDS; each value is
+        taken from the first matching table row that parses, else None.
+        Handles comma-formatted large ROI values like 2,015% as well as −84%.
+        """
+        result: Dict[str, Optional[float]] = dict.fromkeys(_ROI_ROW_KEYWORDS)
+        pending = list(_ROI_ROW_KEYWORDS)
 
-    def _parse_roi_payback(self, roi_text: str) -> Optional[float]:
-        """Extract the payback period in years from the ROI table."""
-        for line in roi_text.split('\n'):
+        for line in roi_text.splitlines():
             if '|' not in line:
                 continue
             lower = line.lower()
-            if 'payback' in lower or 'amortisation' in lower:
-                m = re.search(r'(\d+\.?\d*)\s*year', line, re.IGNORECASE)
-                if m:
-                    return float(m.group(1))
-        return None
+            # One scan over the row finds the keywords of every field
+            hits = {_ROI_KEYWORD_FIELDS[m.group()] for m in _ROI_KEYWORD_RE.finditer(lower)}
+            if 'roi' in lower and '3' in lower:
+                hits.add('roi_percent')
+            for field in pending:
+                if field not in hits:
+                    continue
+                value = self._parse_roi_row(field, line)
+                if value is not None:
+                    result[field] = value
+            pending = [f for f in pending if result[f] is None]
+            if not pending:
+                break
 
-    def _parse_roi_percent(self, roi_text: str) -> Optional[float]:
-        """Extract the 3-year ROI percentage from the ROI table.
+        return result
 
-        Handles comma-formatted large values like 2,015% as well as −84%.
-        """
-        for line in roi_text.split('\n'):
-            if '|' not in line:
-                continue
-            lower = line.lower()
-            if ('3-year roi' in lower or '3-jahres-roi' in lower
-                    or ('roi' in lower and '3' in lower)):
-                m = re.search(r'(-?[\d][,\.\d]*)\s*%', line)
-                if m:
-                    return self._parse_eur_value(m.group(1))
+    def _parse_roi_row(self, field: str, line: str) -> Optional[float]:
+        """Parse the value of one ROI table row for the given result field."""
+        if field == 'payback_years':
+            m = _PAYBACK_YEAR_RE.search(line)
+            return float(m.group(1)) if m else None
+        if field == 'roi_percent':
+            m = _ROI_PCT_RE.search(line)
+            return self._parse_eur_value(m.group(1)) if m else None
+
+        # Euro rows: the value is the last non-empty cell that parses
+        cols = [c.strip() for c in line.split('|')]
+        for col in reversed(cols):
+            if col and col not in ('', '-', '—'):
+                val = self._parse_eur_value(col)
+                if val is not None:
+                    return val
         return None
 
     def _validate_and_correct_roi(
@@ -950,13 +1160,10 @@ class CostEstimationService:
             return
 
         roi_text = roi_finding.finding_text
+        roi_table = self._parse_roi_table(roi_text)
 
-        annual_recurring = self._parse_roi_table_value(
-            roi_text, ['annual recurring', 'recurring costs', 'laufende kosten']
-        )
-        initial_investment = self._parse_roi_table_value(
-            roi_text, ['initial investment', 'erstinvestition']
-        )
+        annual_recurring = roi_table['annual_recurring']
+        initial_investment = roi_table['initial_investment']
 
         if annual_recurring is None or initial_investment is None:
             logger.debug(
@@ -987,8 +1194,8 @@ class CostEstimationService:
             if not any(w in text_lower for w in ('never', 'nie', 'non-viable', 'nicht rentabel')):
                 needs_correction = True
         else:
-            llm_payback = self._parse_roi_payback(roi_text)
-            llm_roi = self._parse_roi_percent(roi_text)
+            llm_payback = roi_table['payback_years']
+            llm_roi = roi_table['roi_percent']
             if (llm_payback is not None and computed_payback is not None
                     and abs(llm_payback - computed_payback) / max(computed_payback, 0.01) > 0.15):
                 needs_correction = True
@@ -1023,7 +1230,12 @@ class CostEstimationService:
             payback_str, f"{computed_roi:.1f}%" if computed_roi else "n/a",
         )
 
-    def _extract_section(self, text: str, section_name: str) -> Optional[str]:
+    def _extract_section(
+        self,
+        text: str,
+        section_name: str,
+        lines: Optional[Tuple[List[str], List[str]]] = None
+    ) -> Optional[str]:
         """Extract a section from formatted text.
 
         Handles multiple header styles:
@@ -1037,43 +1249,28 @@ class CostEstimationService:
         - Unicode dash normalization: U+2011 non-breaking hyphen → ASCII hyphen before matching
         - Wiki-link header normalization: [[id|Text]] → Text
         - Bold next_section guard uses [^a-z*\\n]* to avoid matching inline labels like **Stufe 2 – Text**
-        """
-        import re
 
+        Callers looking up several sections of the same text pass
+        lines=_section_lines(text) so it is split and normalized only once.
+        """
         if not text or not section_name:
             return None
 
-        # Normalize Unicode dashes (U+2010–U+2015, U+2212) to ASCII hyphen
-        # Also strip wiki-link wrappers [[id|Display Text]] → Display Text
-        _DASH_RE = re.compile(r'[\u2010\u2011\u2012\u2013\u2014\u2015\u2212]')
-        _WIKI_HEADER_RE = re.compile(r'\[\[[^\]|]*\|([^\]]+)\]\]')
-
-        def norm(s: str) -> str:
-            s = _DASH_RE.sub('-', s)
-            s = _WIKI_HEADER_RE.sub(r'\1', s)  # [[id|Text]] → Text
-            return s
-
-        esc = re.escape(norm(section_name))
-
-        # Patterns: (regex, captures_hash_level)
-        # First pattern captures the leading #+ as group(1) to detect header level
-        header_patterns = [
-            (rf'^(#{{2,6}})\s*\*{{0,2}}(?:\d+\.\s*)?{esc}\*{{0,2}}[^\n]*$', True),   # ## to ###### SECTION
-            (rf'^\*\*#{{1,3}}\s*(?:\d+\.\s*)?{esc}[^\n]*$', False),                    # **## SECTION (bold wraps hash)
-            (rf'^\*\*(?:\d+\.\s*)?{esc}\*\*[:\s]*$', False),                           # **SECTION**: (colon outside bold)
-            (rf'^\*\*(?:\d+\.\s*)?{esc}:\*\*\s*$', False),                             # **SECTION:** (colon inside bold)
-            (rf'^(?:\d+\.\s*)?{esc}[:\s]*$', False),                                   # SECTION: (plain)
-        ]
+        needle = _normalize_header(section_name)
+        header_patterns = _section_header_patterns(re.escape(needle))
+        needle = needle.lower()
 
-        lines = text.split('\n')
+        lines, normed_lines = lines or _section_lines(text)
         start_pos = None
         start_line_end = None
         start_level = 2  # default: treat as ## level
 
-        for i, line in enumerate(lines):
-            normed = norm(line.strip())
+        for i, normed in enumerate(normed_lines):
+            # Every header pattern contains the section name literally
+            if needle not in normed.lower():
+                continue
             for pattern, captures_level in header_patterns:
-                m = re.match(pattern, normed, re.IGNORECASE)
+                m = pattern.match(normed)
                 if m:
                     start_pos = i
                     start_line_end = i + 1
@@ -1087,19 +1284,10 @@ class CostEstimationService:
             return None
 
         end_pos = len(lines)
-        # Level-aware end detection: only stop at headers with depth ≤ start_level
-        # Bold is only a header if ALL-CAPS (no lowercase in bold text — avoids matching inline labels)
-        next_section_pattern = (
-            rf'^('
-            rf'#{{2,{start_level}}}\s+\*{{0,2}}(?:\d+\.\s*)?[A-Z]'     # ## .. start_level headers
-            rf'|\*\*#{{1,3}}\s+(?:\d+\.\s*)?[A-Z]'                     # **## SECTION (bold wraps hash)
-            rf'|\*\*(?:\d+\.\s*)?[A-Z][^a-z*\n]*\*\*\s*:?\s*$'        # **ALL CAPS** (no lowercase)
-            rf'|[A-Z]{{3,}}[A-Z\s\-()]*[:\s]*$'                        # PLAIN ALLCAPS
-            rf')'
-        )
+        next_section_re = _next_section_re(start_level)
         for i in range(start_line_end, len(lines)):
-            normed = norm(lines[i].strip())
-            if normed and re.match(next_section_pattern, normed):
+            normed = normed_lines[i]
+            if normed and next_section_re.match(normed):
                 end_pos = i
                 break
 
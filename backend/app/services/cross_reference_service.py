@@ -6,10 +6,12 @@ Uses LLM to identify semantic links between findings for wiki-style cross-refere
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 from litellm import completion
 
+from ..config import settings
 from ..models import ConsultationFinding, FindingCrossReference
 from .session_settings import get_llm_settings
 from ..utils.llm import apply_model_params, extract_content
@@ -62,6 +64,31 @@ RELATIONSHIP_TYPES = [
     "quantifies",      # This finding provides numbers for the target
 ]
 
+# Findings sent to the LLM per extraction request. Batching avoids one
+# round-trip per finding while keeping prompt and response sizes bounded.
+BATCH_SIZE = 6
+_MAX_TOKENS_PER_FINDING = 500
+
+# Below this many new references, plain session.add_all() is used
+_BULK_INSERT_THRESHOLD = 10
+
+_RELATIONSHIP_GUIDE = {
+    "en": """RELATIONSHIP TYPES:
+- references: General mention/reference
+- depends_on: This requires/assumes the target section
+- supports: This provides evidence for the target section
+- contradicts: This conflicts with the target section
+- elaborates: This expands on the target section
+- quantifies: This provides numbers for the target section""",
+    "de": """BEZIEHUNGSTYPEN:
+- references: Allgemeine Erwähnung/Verweis
+- depends_on: Setzt den Zielabschnitt voraus
+- supports: Liefert Beweise für den Zielabschnitt
+- contradicts: Steht im Widerspruch zum Zielabschnitt
+- elaborates: Führt den Zielabschnitt weiter aus
+- quantifies: Liefert Zahlen für den Zielabschnitt""",
+}
+
 
 def extract_cross_references(
     db: Session,
@@ -70,7 +97,8 @@ def extract_cross_references(
     model: str,
     api_key: Optional[str] = None,
     api_base: Optional[str] = None,
-    language: str = "en"
+    language: str = "en",
+    precomputed_targets: Optional[Dict[str, str]] = None
 ) -> List[FindingCrossReference]:
     """
     Extract cross-references from a finding using LLM.
@@ -83,6 +111,8 @@ def extract_cross_references(
         api_key: Optional API key
         api_base: Optional API base URL
         language: Language for the prompt
+        precomputed_targets: Optional {factor_type: description} of the finding
+            types present in the session, as built by _session_targets()
 
     Returns:
         List of FindingCrossReference objects (not yet committed)
@@ -90,10 +120,13 @@ def extract_cross_references(
     if not finding.finding_text or len(finding.finding_text) < 50:
         return []
 
+    if precomputed_targets is None:
+        precomputed_targets = _session_targets(all_findings)
+
     # Build list of available targets (exclude self)
     available_targets = {
-        k: v for k, v in FINDING_TYPES.items()
-        if k != finding.factor_type and k in all_findings
+        k: v for k, v in precomputed_targets.items()
+        if k != finding.factor_type
     }
 
     if not available_targets:
@@ -107,47 +140,104 @@ def extract_cross_references(
     )
 
     try:
-        completion_kwargs = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": _get_system_prompt(language)},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.3,  # Lower temperature for more consistent extraction
-            "max_tokens": 1500,
-            "response_format": {"type": "json_object"}
-        }
-
-        if api_key:
-            completion_kwargs["api_key"] = api_key
-        if api_base:
-            completion_kwargs["api_base"] = api_base
-        apply_model_params(completion_kwargs)
-
-        response = completion(**completion_kwargs)
-        content = extract_content(response)
+        content = _call_extraction_llm(
+            _get_system_prompt(language),
+            prompt,
+            model=model,
+            api_key=api_key,
+            api_base=api_base,
+            max_tokens=1500
+        )
 
         # Parse the JSON response
         references = _parse_llm_response(content)
 
-        # Create FindingCrossReference objects
+        cross_refs = [
+            _make_cross_reference(finding, ref)
+            for ref in references
+            if ref.get("target") in available_targets
+        ]
+
+        logger.info(f"Extracted {len(cross_refs)} cross-references from {finding.factor_type}")
+        return cross_refs
+
+    except Exception as e:
+        logger.error(f"Failed to extract cross-references: {e}")
+        return []
+
+
+def extract_cross_references_batch(
+    db: Session,
+    findings: List[ConsultationFinding],
+    all_findings: Dict[str, str],
+    model: str,
+    api_key: Optional[str] = None,
+    api_base: Optional[str] = None,
+    language: str = "en",
+    precomputed_targets: Optional[Dict[str, str]] = None
+) -> List[FindingCrossReference]:
+    """
+    Extract cross-references for several findings with a single LLM request.
+
+    Args:
+        db: Database session
+        findings: The source findings to extract references from
+        all_findings: Dict of {factor_type: finding_text} for all findings in session
+        model: LLM model to use
+        api_key: Optional API key
+        api_base: Optional API base URL
+        language: Language for the prompt
+        precomputed_targets: Optional {factor_type: description} of the finding
+            types present in the session, as built by _session_targets()
+
+    Returns:
+        List of FindingCrossReference objects (not yet committed)
+    """
+    session_targets = precomputed_targets
+    if session_targets is None:
+        session_targets = _session_targets(all_findings)
+
+    findings = [f for f in findings if f.finding_text and len(f.finding_text) >= 50]
+    if len(findings) <= 1:
+        return [
+            ref
+            for finding in findings
+            for ref in extract_cross_references(
+                db, finding, all_findings, model, api_key, api_base, language,
+                precomputed_targets=session_targets
+            )
+        ]
+
+    findings_by_type = {f.factor_type: f for f in findings}
+
+    prompt = _build_batch_extraction_prompt(findings, session_targets, language)
+
+    try:
+        content = _call_extraction_llm(
+            _get_system_prompt(language, batch=True),
+            prompt,
+            model=model,
+            api_key=api_key,
+            api_base=api_base,
+            max_tokens=_MAX_TOKENS_PER_FINDING * len(findings)
+        )
+
+        references = _parse_llm_response(content)
+
         cross_refs = []
         for ref in references:
+            finding = findings_by_type.get(ref.get("source"))
             target_type = ref.get("target")
-            if target_type not in available_targets:
+            if finding is None or target_type == finding.factor_type:
                 continue
+            if target_type not in session_targets:
+                continue
+            cross_refs.append(_make_cross_reference(finding, ref))
 
-            cross_ref = FindingCrossReference(
-                session_id=finding.session_id,
-                source_finding_id=finding.id,
-                target_finding_type=target_type,
-                linked_phrase=ref.get("phrase", "")[:500],  # Limit length
-                relationship_type=ref.get("relationship", "references"),
-                confidence=ref.get("confidence", 80)
-            )
-            cross_refs.append(cross_ref)
-
-        logger.info(f"Extracted {len(cross_refs)} cross-references from {finding.factor_type}")
+        logger.info(
+            f"Extracted {len(cross_refs)} cross-references from "
+            f"{len(findings)} findings in one request"
+        )
         return cross_refs
 
     except Exception as e:
@@ -155,38 +245,100 @@ def extract_cross_references(
         return []
 
 
-def _get_system_prompt(language: str) -> str:
-    """Get the system prompt for cross-reference extraction."""
+def _session_targets(all_findings: Dict[str, str]) -> Dict[str, str]:
+    """Return the FINDING_TYPES entries that exist in the session."""
+    return {k: v for k, v in FINDING_TYPES.items() if k in all_findings}
+
+
+def _call_extraction_llm(
+    system_prompt: str,
+    prompt: str,
+    model: str,
+    api_key: Optional[str],
+    api_base: Optional[str],
+    max_tokens: int
+) -> str:
+    """Run a JSON-mode extraction completion and return its text content."""
+    completion_kwargs = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.3,  # Lower temperature for more consistent extraction
+        "max_tokens": max_tokens,
+        "response_format": {"type": "json_object"}
+    }
+
+    if api_key:
+        completion_kwargs["api_key"] = api_key
+    if api_base:
+        completion_kwargs["api_base"] = api_base
+    apply_model_params(completion_kwargs)
+
+    response = completion(**completion_kwargs)
+    return extract_content(response)
+
+
+def _make_cross_reference(finding: ConsultationFinding, ref: Dict) -> FindingCrossReference:
+    """Build a FindingCrossReference from a validated LLM reference."""
+    return FindingCrossReference(
+        session_id=finding.session_id,
+        source_finding_id=finding.id,
+        target_finding_type=ref.get("target"),
+        linked_phrase=ref.get("phrase", "")[:500],  # Limit length
+        relationship_type=ref.get("relationship", "references"),
+        confidence=ref.get("confidence", 80)
+    )
+
+
+def _get_system_prompt(language: str, batch: bool = False) -> str:
+    """Get the system prompt for cross-reference extraction.
+
+    In batch mode the model returns references grouped by source section
+    under "per_source" instead of a flat "references" list.
+    """
     if language == "de":
-        return """Du bist ein Experte für Dokumentenanalyse. Deine Aufgabe ist es, semantische Querverweise
+        intro = """Du bist ein Experte für Dokumentenanalyse. Deine Aufgabe ist es, semantische Querverweise
 zwischen verschiedenen Abschnitten eines Beratungsberichts zu identifizieren.
 
 Antworte IMMER mit gültigem JSON im folgenden Format:
-{
-  "references": [
-    {
+"""
+        ref = """{
       "phrase": "exakte Phrase aus dem Text",
       "target": "ziel_abschnitt_id",
       "relationship": "references|depends_on|supports|contradicts|elaborates|quantifies",
       "confidence": 80
-    }
-  ]
-}"""
-
-    return """You are an expert at document analysis. Your task is to identify semantic cross-references
+    }"""
+        source_id = "quell_abschnitt_id"
+    else:
+        intro = """You are an expert at document analysis. Your task is to identify semantic cross-references
 between different sections of a consultation report.
 
 ALWAYS respond with valid JSON in this format:
-{
-  "references": [
-    {
+"""
+        ref = """{
       "phrase": "exact phrase from the text",
       "target": "target_section_id",
       "relationship": "references|depends_on|supports|contradicts|elaborates|quantifies",
       "confidence": 80
-    }
+    }"""
+        source_id = "source_section_id"
+
+    if batch:
+        return intro + f"""{{
+  "per_source": {{
+    "{source_id}": [
+    {ref}
+    ]
+  }}
+}}"""
+
+    return intro + f"""{{
+  "references": [
+    {ref}
   ]
-}"""
+}}"""
 
 
 def _build_extraction_prompt(
@@ -209,13 +361,7 @@ TEXT:
 VERFÜGBARE ZIELABSCHNITTE:
 {targets_list}
 
-BEZIEHUNGSTYPEN:
-- references: Allgemeine Erwähnung/Verweis
-- depends_on: Setzt den Zielabschnitt voraus
-- supports: Liefert Beweise für den Zielabschnitt
-- contradicts: Steht im Widerspruch zum Zielabschnitt
-- elaborates: Führt den Zielabschnitt weiter aus
-- quantifies: Liefert Zahlen für den Zielabschnitt
+{_RELATIONSHIP_GUIDE["de"]}
 
 Finde 0-5 relevante Querverweise. Sei präzise - verlinke nur, wenn eine echte semantische Verbindung besteht."""
 
@@ -228,37 +374,88 @@ TEXT:
 AVAILABLE TARGET SECTIONS:
 {targets_list}
 
-RELATIONSHIP TYPES:
-- references: General mention/reference
-- depends_on: This requires/assumes the target section
-- supports: This provides evidence for the target section
-- contradicts: This conflicts with the target section
-- elaborates: This expands on the target section
-- quantifies: This provides numbers for the target section
+{_RELATIONSHIP_GUIDE["en"]}
 
 Find 0-5 relevant cross-references. Be precise - only link when there's a genuine semantic connection."""
 
 
+def _build_batch_extraction_prompt(
+    findings: List[ConsultationFinding],
+    available_targets: Dict[str, str],
+    language: str
+) -> str:
+    """Build one prompt asking for the cross-references of several findings."""
+
+    targets_list = "\n".join([f"- {k}: {v}" for k, v in available_targets.items()])
+
+    if language == "de":
+        sections = "\n\n".join(
+            f'ABSCHNITT {i}: "{f.factor_type}"\n{f.finding_text}'
+            for i, f in enumerate(findings, 1)
+        )
+        return f"""Analysiere die folgenden {len(findings)} Abschnitte eines Berichts. Identifiziere für jeden
+Abschnitt Phrasen, die auf andere Abschnitte des Berichts verweisen.
+
+{sections}
+
+VERFÜGBARE ZIELABSCHNITTE:
+{targets_list}
+
+{_RELATIONSHIP_GUIDE["de"]}
+
+Finde je Abschnitt 0-5 relevante Querverweise und liste sie in "per_source" unter der ID des Abschnitts.
+Verlinke einen Abschnitt nie mit sich selbst. Sei präzise - verlinke nur, wenn eine echte semantische Verbindung besteht."""
+
+    sections = "\n\n".join(
+        f'SECTION {i}: "{f.factor_type}"\n{f.finding_text}'
+        for i, f in enumerate(findings, 1)
+    )
+    return f"""Analyze the following {len(findings)} sections of a report. For each section, identify
+phrases that reference other sections of the report.
+
+{sections}
+
+AVAILABLE TARGET SECTIONS:
+{targets_list}
+
+{_RELATIONSHIP_GUIDE["en"]}
+
+For each section, find 0-5 relevant cross-references and list them in "per_source" under that section's id.
+Never link a section to itself. Be precise - only link when there's a genuine semantic connection."""
+
+
+def _is_valid(ref) -> bool:
+    """Check that a parsed reference is a dict with a phrase and a target."""
+    return isinstance(ref, dict) and bool(ref.get("phrase")) and bool(ref.get("target"))
+
+
+def _normalize_ref(ref: Dict) -> Dict:
+    """Apply the default relationship and confidence to a valid reference."""
+    if ref.get("relationship") not in RELATIONSHIP_TYPES:
+        ref["relationship"] = "references"
+    if not isinstance(ref.get("confidence"), int):
+        ref["confidence"] = 80
+    return ref
+
+
 def _parse_llm_response(content: str) -> List[Dict]:
-    """Parse the LLM's JSON response."""
+    """Parse the LLM's JSON response (single or batch format)."""
     try:
         data = json.loads(content)
-        references = data.get("references", [])
-
-        # Validate each reference
-        valid_refs = []
-        for ref in references:
-            if not isinstance(ref, dict):
-                continue
-            if not ref.get("phrase") or not ref.get("target"):
-                continue
-            if ref.get("relationship") not in RELATIONSHIP_TYPES:
-                ref["relationship"] = "references"
-            if not isinstance(ref.get("confidence"), int):
-                ref["confidence"] = 80
-            valid_refs.append(ref)
-
-        return valid_refs
+        if "per_source" in data:
+            # Batch format: {"per_source": {source_type: [refs]}} → flat list
+            # with each reference tagged with its "source"
+            references = [
+                {**ref, "source": source}
+                for source, refs in (data.get("per_source") or {}).items()
+                if isinstance(refs, list)
+                for ref in refs
+                if isinstance(ref, dict)
+            ]
+        else:
+            references = data.get("references", [])
+
+        return [_normalize_ref(ref) for ref in references if _is_valid(ref)]
 
     except json.JSONDecodeError as e:
         logger.warning(f"Failed to parse LLM response as JSON: {e}")
@@ -297,28 +494,49 @@ def extract_all_cross_references(
 
     # Build dict of all findings
     all_findings = {f.factor_type: f.finding_text for f in findings}
+    session_targets = _session_targets(all_findings)
 
-    # Clear existing cross-references for this session
+    # Clear existing cross-references for this session. Nothing in the
+    # session holds these rows, so skip synchronizing the identity map.
     db.query(FindingCrossReference).filter(
         FindingCrossReference.session_id == session_id
-    ).delete()
+    ).delete(synchronize_session=False)
 
-    total_refs = 0
+    eligible = [f for f in findings if f.finding_text and len(f.finding_text) >= 50]
+    batches = [eligible[i:i + BATCH_SIZE] for i in range(0, len(eligible), BATCH_SIZE)]
 
-    for finding in findings:
-        cross_refs = extract_cross_references(
+    def _extract(batch: List[ConsultationFinding]) -> List[FindingCrossReference]:
+        return extract_cross_references_batch(
             db=db,
-            finding=finding,
+            findings=batch,
             all_findings=all_findings,
             model=model,
             api_key=api_key,
             api_base=api_base,
-            language=language
+            language=language,
+            precomputed_targets=session_targets
         )
 
-        for ref in cross_refs:
-            db.add(ref)
-            total_refs += 1
+    # LLM calls are I/O-bound, so batches run in parallel threads. The
+    # workers only build transient objects; adding them to the (non
+    # thread-safe) SQLAlchemy session happens below in this thread.
+    max_workers = max(1, min(len(batches), settings.cross_ref_max_workers))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_extract, batches))
+    else:
+        results = [_extract(batch) for batch in batches]
+
+    new_refs = [ref for cross_refs in results for ref in cross_refs]
+    total_refs = len(new_refs)
+
+    db.flush()
+
+    # Larger result sets skip per-instance unit-of-work bookkeeping
+    if total_refs >= _BULK_INSERT_THRESHOLD:
+        db.bulk_save_objects(new_refs)
+    else:
+        db.add_all(new_refs)
 
     db.commit()
     logger.info(f"Created {total_refs} cross-references for session {session_id}")
@@ -336,21 +554,17 @@ def get_cross_references_for_session(
     Returns:
         Dict mapping source_factor_type to list of cross-reference dicts
     """
-    refs = db.query(FindingCrossReference).filter(
+    # Resolve each reference's source finding type in the same query
+    rows = db.query(FindingCrossReference, ConsultationFinding.factor_type).outerjoin(
+        ConsultationFinding,
+        FindingCrossReference.source_finding_id == ConsultationFinding.id
+    ).filter(
         FindingCrossReference.session_id == session_id
     ).all()
 
-    # Get the source finding types
-    finding_ids = {r.source_finding_id for r in refs}
-    findings = db.query(ConsultationFinding).filter(
-        ConsultationFinding.id.in_(finding_ids)
-    ).all() if finding_ids else []
-
-    finding_type_map = {f.id: f.factor_type for f in findings}
-
     result = {}
-    for ref in refs:
-        source_type = finding_type_map.get(ref.source_finding_id, "unknown")
+    for ref, source_type in rows:
+        source_type = source_type or "unknown"
         if source_type not in result:
             result[source_type] = []
 
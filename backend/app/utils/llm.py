@@ -2,7 +2,7 @@
 
 import re
 import logging
-from typing import Dict, List, Generator, Optional
+from typing import Any, Callable, Dict, List, Generator, Optional, Sequence, Tuple
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -76,6 +76,58 @@ def extract_content(response) -> str:
     return strip_think_tokens(content).strip()
 
 
+def run_extraction(
+    call_llm: Callable[..., Any],
+    messages: List[Dict],
+    core_prompt: str,
+    full_prompt: str,
+    required_sections: Sequence[Tuple[str, ...]],
+    find_section: Callable[[Any, str], Optional[str]],
+    label: str,
+    session_uuid: str,
+    parse: Optional[Callable[[str], Any]] = None,
+    max_tokens: int = 6000
+) -> Tuple[str, Any]:
+    """Run an extraction prompt, retrying once with its worked examples.
+
+    The first attempt sends core_prompt, which omits the worked examples
+    (about half of the prompt). The extraction is repeated with full_prompt
+    only if the answer lacks one of required_sections (each a tuple of
+    aliases, looked up with find_section) and the two prompts differ.
+
+    Args:
+        call_llm: The service's extraction call, e.g. _call_llm_extraction
+        messages: Conversation history the extraction prompt is appended to
+        core_prompt: Extraction prompt without the worked examples
+        full_prompt: Extraction prompt with the worked examples
+        required_sections: Sections the parser needs, as alias tuples
+        find_section: find_section(parsed, name) returns the section text or None
+        label: Name of the extraction for the retry log message
+        session_uuid: Session the extraction runs for, for the log message
+        parse: Turns a summary into what find_section expects (default: the summary)
+        max_tokens: Token limit of each extraction call
+
+    Returns:
+        Tuple of (summary, parse(summary)) for the answer that was kept
+    """
+    parse = parse or (lambda summary: summary)
+
+    def attempt(prompt: str) -> Tuple[str, Any]:
+        response = call_llm(messages + [{"role": "user", "content": prompt}], max_tokens=max_tokens)
+        summary = extract_content(response)
+        return summary, parse(summary)
+
+    summary, parsed = attempt(core_prompt)
+    if full_prompt == core_prompt or all(
+        any(find_section(parsed, name) for name in names)
+        for names in required_sections
+    ):
+        return summary, parsed
+
+    logger.info("Retrying %s extraction with examples for session %s", label, session_uuid)
+    return attempt(full_prompt)
+
+
 def apply_model_params(completion_kwargs: dict) -> dict:
     """Apply model-specific parameters required by certain providers."""
     model = completion_kwargs.get("model", "")
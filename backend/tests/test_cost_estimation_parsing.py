@@ -0,0 +1,242 @@
+"""Tests for the Step 5b cost estimation parsing helpers:
+1. _parse_eur_value (EN/DE separators, suffixes, signs)
+2. _extract_annual_benefit_from_5a
+3. ROI table parsing (recurring costs, initial investment, payback, ROI %)
+4. _extract_section header styles and level-aware end detection
+5. _run_extraction retry with worked examples
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from app.services.cost_estimation_service import CostEstimationService, _section_lines
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_cost_service(language: str = "en") -> CostEstimationService:
+    """Create a CostEstimationService instance without a real DB."""
+    svc = CostEstimationService.__new__(CostEstimationService)
+    svc.language = language
+    svc.custom_prompts = {}
+    svc.chat_temperature = None
+    svc.extraction_temperature = None
+    svc._llm = MagicMock()
+    return svc
+
+
+ROI_TABLE = """| Metric | Value |
+|--------|-------|
+| Annual Benefit (moderate) | €120,000 |
+| Annual Recurring + Maintenance | €20.000 |
+| Initial Investment | **€50,000** |
+| Simple Payback Period | 0.5 years |
+| 3-Year ROI | 2,015% |
+"""
+
+
+# ===========================================================================
+# 1 — _parse_eur_value
+# ===========================================================================
+
+class TestParseEurValue:
+
+    @pytest.mark.parametrize("text, expected", [
+        ("€1,000", 1000.0),
+        ("€1.000", 1000.0),
+        ("1.000,50", 1000.5),
+        ("1,000.50", 1000.5),
+        ("**€45,000**", 45000.0),
+        ("€ 12 500", 12500.0),
+        ("120k", 120_000.0),
+        ("1.5M", 1_500_000.0),
+        ("-84", -84.0),
+        ("−2.500", -2500.0),
+    ])
+    def test_parses_amounts(self, text, expected):
+        assert _make_cost_service()._parse_eur_value(text) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("text", ["", None, "n/a", "—"])
+    def test_unparseable_returns_none(self, text):
+        assert _make_cost_service()._parse_eur_value(text) is None
+
+
+# ===========================================================================
+# 2 — _extract_annual_benefit_from_5a
+# ===========================================================================
+
+class TestExtractAnnualBenefit:
+
+    def test_total_annual_benefit_en(self):
+        value, display = _make_cost_service()._extract_annual_benefit_from_5a(
+            {"calculation": "**Total Annual Benefit (moderate):** €119,000 per year"}
+        )
+        assert value == 119_000
+        assert display == "€119,000"
+
+    def test_gesamter_jahresnutzen_de(self):
+        value, display = _make_cost_service()._extract_annual_benefit_from_5a(
+            {"calculation": "Gesamter Jahresnutzen: € 2.400.000"}
+        )
+        assert value == 2_400_000
+        assert display == "€2.40M"
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Gesamter Jahresnutzen: €119.000", "€119.000"),
+        ("Gesamter Jahresnutzen: € 2.400.000", "€2,40 Mio."),
+    ])
+    def test_german_display_format(self, text, expected):
+        _, display = _make_cost_service("de")._extract_annual_benefit_from_5a({"calculation": text})
+        assert display == expected
+
+    def test_missing_calculation(self):
+        value, display = _make_cost_service()._extract_annual_benefit_from_5a({})
+        assert value is None
+        assert "Step 5a" in display
+
+    def test_no_match(self):
+        value, _ = _make_cost_service()._extract_annual_benefit_from_5a(
+            {"calculation": "Benefits are substantial."}
+        )
+        assert value is None
+
+
+# ===========================================================================
+# 3 — ROI table parsing
+# ===========================================================================
+
+class TestRoiTableParsing:
+
+    def test_parses_all_rows(self):
+        assert _make_cost_service()._parse_roi_table(ROI_TABLE) == {
+            'annual_recurring': 20_000,
+            'initial_investment': 50_000,
+            'payback_years': 0.5,
+            'roi_percent': 2015,
+        }
+
+    def test_german_rows(self):
+        text = (
+            "| Kennzahl | Wert |\n"
+            "| Laufende Kosten pro Jahr | €8.000 |\n"
+            "| Erstinvestition | €40.000 |\n"
+            "| Amortisation | 1.5 years |\n"
+            "| 3-Jahres-ROI | -84 % |\n"
+        )
+        assert _make_cost_service()._parse_roi_table(text) == {
+            'annual_recurring': 8_000,
+            'initial_investment': 40_000,
+            'payback_years': 1.5,
+            'roi_percent': -84,
+        }
+
+    def test_first_parseable_row_wins(self):
+        text = (
+            "| Initial investment | TBD |\n"
+            "| Initial investment (revised) | €60,000 |\n"
+            "| Initial investment (old) | €10,000 |\n"
+        )
+        assert _make_cost_service()._parse_roi_table(text)['initial_investment'] == 60_000
+
+    def test_payback_skips_unit_in_label(self):
+        text = "| Payback period (years) | 1.5 years |\n"
+        assert _make_cost_service()._parse_roi_table(text)['payback_years'] == 1.5
+
+    def test_payback_in_padded_cell(self):
+        text = "| Payback period | 1.5                       years |\n"
+        assert _make_cost_service()._parse_roi_table(text)['payback_years'] == 1.5
+
+    def test_rows_without_pipes_are_ignored(self):
+        text = "Initial investment: €50,000\nPayback: 2 years\n3-year ROI: 40%"
+        result = _make_cost_service()._parse_roi_table(text)
+        assert all(v is None for v in result.values())
+
+
+# ===========================================================================
+# 4 — _extract_section
+# ===========================================================================
+
+class TestExtractSection:
+
+    def test_markdown_header(self):
+        text = "## COST DRIVERS\nData labelling.\n\n## COST OPTIMIZATION OPTIONS\nReuse."
+        assert _make_cost_service()._extract_section(text, "COST DRIVERS") == "Data labelling."
+
+    def test_numbered_bold_header(self):
+        text = "**1. COMPLEXITY ASSESSMENT**\nLevel: Standard\n**2. INITIAL INVESTMENT**\n€10k"
+        assert _make_cost_service()._extract_section(text, "COMPLEXITY ASSESSMENT") == "Level: Standard"
+
+    def test_subsections_do_not_end_parent(self):
+        text = (
+            "## INITIAL INVESTMENT\nIntro\n### Development\n€5,000\n"
+            "## RECURRING COSTS\n€100"
+        )
+        result = _make_cost_service()._extract_section(text, "INITIAL INVESTMENT")
+        assert "Development" in result
+        assert "€5,000" in result
+        assert "RECURRING" not in result
+
+    def test_unicode_dash_in_header(self):
+        text = "## 3‑YEAR TCO\n€30,000\n## COST DRIVERS\nx"
+        assert _make_cost_service()._extract_section(text, "3-YEAR TCO") == "€30,000"
+
+    def test_wiki_link_header(self):
+        text = "## [[cost_tco|3-YEAR TCO]]\n€30,000\n## COST DRIVERS\nx"
+        assert _make_cost_service()._extract_section(text, "3-YEAR TCO") == "€30,000"
+
+    def test_crlf_line_endings(self):
+        text = "## COST DRIVERS\r\nData labelling.\r\nTooling.\r\n## OTHER\r\nx"
+        assert _make_cost_service()._extract_section(text, "COST DRIVERS") == "Data labelling.\nTooling."
+
+    def test_missing_section(self):
+        assert _make_cost_service()._extract_section("## OTHER\ntext", "TCO") is None
+
+    def test_empty_input(self):
+        assert _make_cost_service()._extract_section("", "TCO") is None
+
+    def test_presplit_lines(self):
+        text = "## COST DRIVERS\nData labelling.\n## TCO\n€90,000"
+        lines = _section_lines(text)
+        svc = _make_cost_service()
+        assert svc._extract_section(text, "COST DRIVERS", lines) == "Data labelling."
+        assert svc._extract_section(text, "TCO", lines) == "€90,000"
+
+
+# ===========================================================================
+# 5 — _run_extraction
+# ===========================================================================
+
+class TestRunExtraction:
+
+    COMPLETE = "## COMPLEXITY ASSESSMENT\nQuick Win\n## INVESTMENT VS. RETURN\n| a | b |"
+
+    def _svc(self, *answers):
+        svc = _make_cost_service()
+        svc._call_llm_extraction = MagicMock(side_effect=[
+            MagicMock(choices=[MagicMock(message=MagicMock(content=a))]) for a in answers
+        ])
+        return svc
+
+    def _prompt(self, svc, call):
+        return svc._call_llm_extraction.call_args_list[call].args[0][-1]["content"]
+
+    def test_complete_answer_without_examples(self):
+        svc = self._svc(self.COMPLETE)
+        assert svc._run_extraction([], "s-1") == (self.COMPLETE, _section_lines(self.COMPLETE))
+        assert svc._call_llm_extraction.call_count == 1
+        assert "## EXAMPLES" not in self._prompt(svc, 0)
+
+    def test_retries_with_examples_when_section_missing(self):
+        svc = self._svc("## COMPLEXITY ASSESSMENT\nQuick Win", self.COMPLETE)
+        assert svc._run_extraction([], "s-1") == (self.COMPLETE, _section_lines(self.COMPLETE))
+        assert svc._call_llm_extraction.call_count == 2
+        assert "## EXAMPLES" in self._prompt(svc, 1)
+
+    def test_custom_prompt_not_retried(self):
+        svc = self._svc("incomplete")
+        svc.custom_prompts = {"cost_estimation_extraction": "Custom extraction prompt"}
+        assert svc._run_extraction([], "s-1")[0] == "incomplete"
+        assert self._prompt(svc, 0) == "Custom extraction prompt"
+        assert svc._call_llm_extraction.call_count == 1
@@ -0,0 +1,150 @@
+"""Tests for coalescing concurrent Step 5b starts of the same session:
+1. two concurrent streaming starts call the LLM once and share its response
+2. replay after the in-flight start succeeded or failed
+3. timeout while another start holds the session lock
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Session as SessionModel
+from app.services import cost_estimation_service
+from app.services.cost_estimation_service import CostEstimationService, _START_LOCKS, _start_lock
+from app.utils.sse import format_sse_data
+
+SESSION_UUID = "s-1"
+LOCK_KEY = f"{SESSION_UUID}:{CostEstimationService.MESSAGE_TYPE}"
+DONE = "data: [DONE]\n\n"
+
+
+@pytest.fixture
+def make_db(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    setup = factory()
+    setup.add(SessionModel(session_uuid=SESSION_UUID))
+    setup.commit()
+    setup.close()
+    sessions = []
+
+    def make():
+        sessions.append(factory())
+        return sessions[-1]
+
+    yield make
+    for session in sessions:
+        session.close()
+    engine.dispose()
+
+
+def _chunk(text):
+    return MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+
+
+def _make_service(db, stream=None):
+    svc = CostEstimationService(db)
+    svc._build_cost_estimation_context = MagicMock(return_value={})
+    svc._build_system_prompt = MagicMock(return_value="system")
+    svc._call_llm_stream = MagicMock(side_effect=stream)
+    return svc
+
+
+def _error_types(events):
+    return [json.loads(event[6:])["type"] for event in events]
+
+
+class TestConcurrentStreamStart:
+
+    def test_second_start_replays_first_response(self, make_db):
+        streaming, release = threading.Event(), threading.Event()
+
+        def slow_stream(*args, **kwargs):
+            streaming.set()
+            release.wait(5)
+            yield _chunk("Hello ")
+            yield _chunk("world")
+
+        first = _make_service(make_db(), slow_stream)
+        second = _make_service(make_db())
+        results = {}
+        thread = threading.Thread(
+            target=lambda: results.setdefault("first", list(first.start_cost_estimation_stream(SESSION_UUID)))
+        )
+        thread.start()
+        assert streaming.wait(5)
+
+        waiter = threading.Thread(
+            target=lambda: results.setdefault("second", list(second.start_cost_estimation_stream(SESSION_UUID)))
+        )
+        waiter.start()
+        deadline = time.monotonic() + 5
+        while _START_LOCKS[LOCK_KEY][1] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        waiting = _START_LOCKS[LOCK_KEY][1] == 2
+        release.set()
+        thread.join(5)
+        waiter.join(5)
+
+        assert waiting
+        assert not thread.is_alive()
+        assert not waiter.is_alive()
+
+        assert results["first"] == [format_sse_data("Hello "), format_sse_data("world"), DONE]
+        assert results["second"] == [format_sse_data("Hello world"), DONE]
+        assert first._call_llm_stream.call_count == 1
+        assert second._call_llm_stream.call_count == 0
+        assert LOCK_KEY not in _START_LOCKS
+
+
+class TestReplayConcurrentStart:
+
+    def test_replay_after_success(self, make_db):
+        first = _make_service(make_db(), lambda *a, **k: iter([_chunk("Done")]))
+        list(first.start_cost_estimation_stream(SESSION_UUID))
+
+        second = _make_service(make_db())
+        events = list(second._replay_concurrent_start(SESSION_UUID, threading.Lock()))
+        assert events == [format_sse_data("Done"), DONE]
+
+    def test_replay_after_failed_start(self, make_db):
+        def failing_stream(*args, **kwargs):
+            raise RuntimeError("provider down")
+            yield
+
+        first = _make_service(make_db(), failing_stream)
+        assert _error_types(first.start_cost_estimation_stream(SESSION_UUID)) == ["error"]
+
+        second = _make_service(make_db())
+        assert _error_types(second._replay_concurrent_start(SESSION_UUID, threading.Lock())) == ["error"]
+
+
+class TestStartTimeout:
+
+    @pytest.fixture(autouse=True)
+    def short_wait(self, monkeypatch):
+        monkeypatch.setattr(cost_estimation_service, "_START_WAIT_SECONDS", 0.05)
+
+    def test_start_times_out_while_locked(self, make_db):
+        svc = _make_service(make_db())
+        with _start_lock(LOCK_KEY) as lock:
+            lock.acquire()
+            try:
+                with pytest.raises(TimeoutError):
+                    svc.start_cost_estimation(SESSION_UUID)
+                events = _error_types(svc.start_cost_estimation_stream(SESSION_UUID))
+            finally:
+                lock.release()
+
+        assert events == ["timeout"]
+        assert svc._call_llm_stream.call_count == 0
+        assert LOCK_KEY not in _START_LOCKS
@@ -305,7 +305,7 @@ class TestNormalizeWikiLinks:
 # ---------------------------------------------------------------------------
 
 class TestDefaultPromptsInjection:
-    """Tests that _inject_cross_refs() correctly replaced all 10 hardcoded blocks."""
+    """Tests that _inject_cross_refs() filled all 10 @crossrefs markers."""
 
     STEP_MAP = {
         "extraction_summary":        "consultation",
@@ -404,3 +404,8 @@ class TestDefaultPromptsInjection:
         ids = _block_ids(DEFAULT_PROMPTS[lang][prompt_key])
         for sid in ids:
             assert sid in ALL_IDS, f"{lang} {prompt_key}: unknown ID {sid!r} in block"
+
+    @pytest.mark.parametrize("lang", ["en", "de"])
+    @pytest.mark.parametrize("prompt_key", STEP_MAP.keys())
+    def test_marker_replaced(self, lang, prompt_key):
+        assert "@crossrefs" not in DEFAULT_PROMPTS[lang][prompt_key]
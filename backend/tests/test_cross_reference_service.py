@@ -0,0 +1,223 @@
+"""Tests for LLM-based cross-reference extraction (cross_reference_service).
+
+Covers:
+- _parse_llm_response: single ("references") and batch ("per_source") formats
+- extract_cross_references_batch: one LLM request per batch, source/target validation
+- extract_all_cross_references: findings are batched by BATCH_SIZE
+- get_cross_references_for_session: references grouped by source finding type
+"""
+
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app.services import cross_reference_service as crs
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+LONG_TEXT = "This finding text is long enough to be considered for cross-referencing. " * 2
+
+
+def _finding(factor_type: str, finding_id: int, text: str = LONG_TEXT):
+    return SimpleNamespace(id=finding_id, session_id=1, factor_type=factor_type, finding_text=text)
+
+
+def _llm_response(payload: dict):
+    message = SimpleNamespace(content=json.dumps(payload))
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+# ---------------------------------------------------------------------------
+# _parse_llm_response
+# ---------------------------------------------------------------------------
+
+class TestParseLlmResponse:
+
+    def test_single_format(self):
+        refs = crs._parse_llm_response(json.dumps({
+            "references": [{"phrase": "ROI", "target": "cost_roi", "relationship": "quantifies", "confidence": 90}]
+        }))
+        assert refs == [{"phrase": "ROI", "target": "cost_roi", "relationship": "quantifies", "confidence": 90}]
+
+    def test_batch_format_tags_source(self):
+        refs = crs._parse_llm_response(json.dumps({
+            "per_source": {
+                "ai_goals": [{"phrase": "plan", "target": "project_plan"}],
+                "cost_roi": [{"phrase": "benefit", "target": "business_case_calculation"}],
+            }
+        }))
+        assert [(r["source"], r["target"]) for r in refs] == [
+            ("ai_goals", "project_plan"),
+            ("cost_roi", "business_case_calculation"),
+        ]
+
+    def test_defaults_applied(self):
+        refs = crs._parse_llm_response(json.dumps({
+            "references": [{"phrase": "x", "target": "ai_goals", "relationship": "bogus", "confidence": "high"}]
+        }))
+        assert refs[0]["relationship"] == "references"
+        assert refs[0]["confidence"] == 80
+
+    def test_invalid_entries_dropped(self):
+        refs = crs._parse_llm_response(json.dumps({
+            "per_source": {"ai_goals": [{"phrase": "", "target": "x"}, "junk", {"target": "y"}], "bad": "junk"}
+        }))
+        assert refs == []
+
+    def test_invalid_json(self):
+        assert crs._parse_llm_response("not json") == []
+
+
+# ---------------------------------------------------------------------------
+# extract_cross_references_batch
+# ---------------------------------------------------------------------------
+
+class TestExtractBatch:
+
+    def test_single_request_for_batch(self):
+        findings = [_finding("ai_goals", 1), _finding("project_plan", 2)]
+        all_findings = {f.factor_type: f.finding_text for f in findings}
+        payload = {"per_source": {
+            "ai_goals": [
+                {"phrase": "roadmap", "target": "project_plan"},
+                {"phrase": "self", "target": "ai_goals"},          # self-link dropped
+                {"phrase": "missing", "target": "cost_roi"},       # not in session
+            ],
+            "project_plan": [{"phrase": "goals", "target": "ai_goals", "relationship": "depends_on"}],
+            "unknown_type": [{"phrase": "x", "target": "ai_goals"}],  # unknown source dropped
+        }}
+        with patch.object(crs, "completion", return_value=_llm_response(payload)) as mock_completion:
+            refs = crs.extract_cross_references_batch(MagicMock(), findings, all_findings, model="m")
+
+        assert mock_completion.call_count == 1
+        assert [(r.source_finding_id, r.target_finding_type) for r in refs] == [(1, "project_plan"), (2, "ai_goals")]
+        assert refs[1].relationship_type == "depends_on"
+
+    def test_one_finding_uses_single_mode(self):
+        findings = [_finding("ai_goals", 1), _finding("project_plan", 2, text="short")]
+        all_findings = {f.factor_type: f.finding_text for f in findings}
+        payload = {"references": [{"phrase": "roadmap", "target": "project_plan"}]}
+        with patch.object(crs, "completion", return_value=_llm_response(payload)) as mock_completion:
+            refs = crs.extract_cross_references_batch(MagicMock(), findings, all_findings, model="m")
+
+        prompt = mock_completion.call_args.kwargs["messages"][1]["content"]
+        assert 'from the "ai_goals" section' in prompt
+        assert [r.target_finding_type for r in refs] == ["project_plan"]
+
+    def test_precomputed_targets_limit_single_mode(self):
+        finding = _finding("ai_goals", 1)
+        all_findings = {"ai_goals": LONG_TEXT, "project_plan": LONG_TEXT, "cost_roi": LONG_TEXT}
+        targets = {"project_plan": crs.FINDING_TYPES["project_plan"]}
+        payload = {"references": [
+            {"phrase": "roadmap", "target": "project_plan"},
+            {"phrase": "roi", "target": "cost_roi"},
+        ]}
+        with patch.object(crs, "completion", return_value=_llm_response(payload)):
+            refs = crs.extract_cross_references(
+                MagicMock(), finding, all_findings, model="m", precomputed_targets=targets
+            )
+        assert [r.target_finding_type for r in refs] == ["project_plan"]
+
+    def test_llm_error_returns_empty(self):
+        findings = [_finding("ai_goals", 1), _finding("project_plan", 2)]
+        all_findings = {f.factor_type: f.finding_text for f in findings}
+        with patch.object(crs, "completion", side_effect=RuntimeError("boom")):
+            assert crs.extract_cross_references_batch(MagicMock(), findings, all_findings, model="m") == []
+
+
+# ---------------------------------------------------------------------------
+# extract_all_cross_references
+# ---------------------------------------------------------------------------
+
+class TestExtractAll:
+
+    def test_findings_are_batched(self):
+        types = list(crs.FINDING_TYPES)[:crs.BATCH_SIZE + 2]
+        findings = [_finding(t, i) for i, t in enumerate(types, 1)]
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = findings
+
+        with patch.object(crs, "completion", return_value=_llm_response({"per_source": {}})) as mock_completion:
+            total = crs.extract_all_cross_references(db, session_id=1, model="m")
+
+        assert total == 0
+        assert mock_completion.call_count == 2
+        db.commit.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# get_cross_references_for_session
+# ---------------------------------------------------------------------------
+
+class TestGetCrossReferences:
+
+    @pytest.fixture
+    def seeded_db(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from app.database import Base
+        from app.models import Session as SessionModel, ConsultationFinding, FindingCrossReference
+
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        session = SessionModel(session_uuid="s-1")
+        db.add(session)
+        db.flush()
+        goals = ConsultationFinding(session_id=session.id, factor_type="ai_goals", finding_text=LONG_TEXT)
+        plan = ConsultationFinding(session_id=session.id, factor_type="project_plan", finding_text=LONG_TEXT)
+        db.add_all([goals, plan])
+        db.flush()
+        db.add_all([
+            FindingCrossReference(session_id=session.id, source_finding_id=goals.id,
+                                  target_finding_type="project_plan", linked_phrase="roadmap"),
+            FindingCrossReference(session_id=session.id, source_finding_id=plan.id,
+                                  target_finding_type="ai_goals", linked_phrase="goals",
+                                  relationship_type="depends_on", confidence=95),
+        ])
+        db.commit()
+        yield db, session.id
+        db.close()
+
+    def test_grouped_by_source_type(self, seeded_db):
+        db, session_id = seeded_db
+        result = crs.get_cross_references_for_session(db, session_id)
+        assert set(result) == {"ai_goals", "project_plan"}
+        assert result["ai_goals"][0]["target"] == "project_plan"
+        assert result["project_plan"][0]["relationship"] == "depends_on"
+        assert result["project_plan"][0]["confidence"] == 95
+
+    def test_unknown_session_is_empty(self, seeded_db):
+        db, _ = seeded_db
+        assert crs.get_cross_references_for_session(db, 999) == {}
+
+
+class TestExtractAllPersistence:
+
+    def _run(self, n_refs: int):
+        types = list(crs.FINDING_TYPES)[:2]
+        findings = [_finding(t, i) for i, t in enumerate(types, 1)]
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = findings
+        payload = {"per_source": {
+            types[0]: [{"phrase": f"p{i}", "target": types[1]} for i in range(n_refs)]
+        }}
+        with patch.object(crs, "completion", return_value=_llm_response(payload)):
+            total = crs.extract_all_cross_references(db, session_id=1, model="m")
+        return db, total
+
+    def test_few_refs_use_add_all(self):
+        db, total = self._run(3)
+        assert total == 3
+        db.add_all.assert_called_once()
+        db.bulk_save_objects.assert_not_called()
+
+    def test_many_refs_use_bulk_save(self):
+        db, total = self._run(crs._BULK_INSERT_THRESHOLD)
+        assert total == crs._BULK_INSERT_THRESHOLD
+        db.bulk_save_objects.assert_called_once()
+        db.add_all.assert_not_called()
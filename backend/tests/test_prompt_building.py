@@ -1,7 +1,9 @@
 """Tests for prompt template retrieval and building."""
 
 import pytest
-from app.services.default_prompts import get_prompt, get_prompt_keys, DEFAULT_PROMPTS
+from app.services.default_prompts import (
+    get_prompt, get_prompt_keys, render_prompt, render_template, DEFAULT_PROMPTS, PROMPTS_DIR,
+)
 
 
 class TestGetPrompt:
@@ -91,3 +93,140 @@ class TestPromptFormatVariables:
         prompt = get_prompt("brainstorming_subsequent", language="en")
         assert "{previous_ideas_numbered}" in prompt
         assert "{round_number}" in prompt
+
+
+class TestStaticPrefix:
+    """System prompts keep their placeholders in a trailing block so the
+    instruction text forms a stable prefix for provider prompt caching."""
+
+    @pytest.mark.parametrize("lang", ["en", "de"])
+    @pytest.mark.parametrize("key", [
+        "brainstorming_system",
+        "consultation_system",
+        "business_case_system",
+        "cost_estimation_system",
+        "transition_briefing_system",
+        "swot_analysis_system",
+    ])
+    def test_placeholders_in_tail(self, lang, key):
+        prompt = DEFAULT_PROMPTS[lang][key]
+        assert prompt.index("{") > len(prompt) * 0.9
+
+
+class TestRenderTemplate:
+    """render_template / render_prompt must match str.format."""
+
+    @pytest.mark.parametrize("lang", ["en", "de"])
+    def test_matches_str_format_for_defaults(self, lang):
+        import string
+        for key, template in DEFAULT_PROMPTS[lang].items():
+            values = {f: f"<{f}>" for _, f, _, _ in string.Formatter().parse(template) if f}
+            assert render_template(template, **values) == template.format(**values), key
+
+    def test_render_prompt_uses_custom_prompt(self):
+        custom = {"brainstorming_round1": "Round {round_number}{uniqueness_note}"}
+        result = render_prompt("brainstorming_round1", "en", custom, round_number=2, uniqueness_note="!")
+        assert result == "Round 2!"
+
+    def test_escaped_braces(self):
+        assert render_template("{{json}} {x}", x=1) == "{json} 1"
+
+    def test_format_spec_falls_back_to_str_format(self):
+        assert render_template("{x:.1f}", x=1) == "1.0"
+
+    def test_missing_value_raises_key_error(self):
+        with pytest.raises(KeyError):
+            render_template("{x}", y=1)
+
+
+class TestLazyPrompts:
+    """DEFAULT_PROMPTS reads each prompt file on first access."""
+
+    def test_prompt_loaded_on_access(self):
+        from app.services import default_prompts
+        default_prompts._load_prompt.cache_clear()
+        assert "de" in DEFAULT_PROMPTS
+        assert "brainstorming_system" in DEFAULT_PROMPTS["de"]
+        assert default_prompts._load_prompt.cache_info().currsize == 0
+        assert DEFAULT_PROMPTS["de"]["brainstorming_system"].startswith("WICHTIG")
+        assert default_prompts._load_prompt.cache_info().currsize == 1
+
+    def test_mapping_and_get_prompt_share_cache(self):
+        from app.services import default_prompts
+        default_prompts._load_prompt.cache_clear()
+        assert get_prompt("consultation_system", "en") is DEFAULT_PROMPTS["en"]["consultation_system"]
+        assert default_prompts._load_prompt.cache_info().currsize == 1
+
+    def test_unknown_key(self):
+        with pytest.raises(KeyError):
+            DEFAULT_PROMPTS["en"]["no_such_prompt"]
+        assert tuple(DEFAULT_PROMPTS["en"]) == get_prompt_keys()
+
+    def test_unknown_language(self):
+        assert "fr" not in DEFAULT_PROMPTS
+        with pytest.raises(KeyError):
+            DEFAULT_PROMPTS["fr"]
+        assert list(DEFAULT_PROMPTS) == ["en", "de"]
+
+    def test_read_only(self):
+        with pytest.raises(TypeError):
+            DEFAULT_PROMPTS["en"] = {}
+        with pytest.raises(TypeError):
+            DEFAULT_PROMPTS["en"]["brainstorming_system"] = "x"
+
+    def test_get_all_defaults_read_only(self):
+        from app.services.default_prompts import get_all_defaults
+        defaults = get_all_defaults()
+        with pytest.raises(TypeError):
+            defaults["de"]["brainstorming_system"] = "x"
+        assert dict(defaults["de"])["brainstorming_system"] == get_prompt("brainstorming_system", "de")
+
+
+class TestExtractionExamples:
+    """Worked examples of the extraction prompts can be left out."""
+
+    @pytest.mark.parametrize("lang,header", [("en", "## EXAMPLES"), ("de", "## BEISPIELE")])
+    @pytest.mark.parametrize("key", ["business_case_extraction", "cost_estimation_extraction"])
+    def test_with_and_without_examples(self, lang, header, key):
+        full = get_prompt(key, lang)
+        core = get_prompt(key, lang, with_examples=False)
+        assert header in full
+        assert header not in core
+        assert "@examples" not in full + core
+        assert full.endswith(core.rsplit("\n\n", 1)[1])
+        assert len(core) < len(full)
+
+    def test_custom_prompt_unchanged(self):
+        custom = {"business_case_extraction": "Custom"}
+        assert get_prompt("business_case_extraction", "en", custom, with_examples=False) == "Custom"
+
+
+class TestPromptMetadata:
+    """Placeholders in the default prompts match the documented variables."""
+
+    @pytest.mark.parametrize("lang", ["en", "de"])
+    def test_placeholders_match_metadata(self, lang):
+        from string import Formatter
+        from app.schemas.expert_settings import PROMPT_METADATA
+
+        variables = {info.key: set(info.variables) for info in PROMPT_METADATA}
+        assert set(variables) == set(get_prompt_keys())
+        for key in get_prompt_keys():
+            fields = {field for _, field, _, _ in Formatter().parse(get_prompt(key, lang)) if field}
+            assert fields == variables[key], key
+
+
+class TestPromptFiles:
+    """Prompt files carry no whitespace that would only cost tokens."""
+
+    @pytest.mark.parametrize("path", sorted(PROMPTS_DIR.glob("*/*.txt")), ids=lambda p: f"{p.parent.name}/{p.name}")
+    def test_no_redundant_whitespace(self, path):
+        text = path.read_text(encoding="utf-8")
+        assert text == text.strip() + "\n"
+        assert not any(line != line.rstrip() for line in text.splitlines())
+        assert "\n\n\n" not in text
+
+    @pytest.mark.parametrize("path", sorted(PROMPTS_DIR.glob("*/*.txt")), ids=lambda p: f"{p.parent.name}/{p.name}")
+    def test_table_separators_are_minimal(self, path):
+        text = path.read_text(encoding="utf-8")
+        assert "----|" not in text
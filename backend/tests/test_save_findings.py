@@ -0,0 +1,76 @@
+"""Tests for _save_findings, the batched finding upsert shared by the
+consultation, business case and cost estimation services."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Session as SessionModel, ConsultationFinding
+from app.services.business_case_service import BusinessCaseService
+from app.services.consultation_service import ConsultationService
+from app.services.cost_estimation_service import CostEstimationService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def session_id(db):
+    session = SessionModel(session_uuid="s-1")
+    db.add(session)
+    db.flush()
+    db.add(ConsultationFinding(session_id=session.id, factor_type="ai_goals", finding_text="old"))
+    db.commit()
+    return session.id
+
+
+def _make_service(service_cls, db):
+    svc = service_cls.__new__(service_cls)
+    svc.db = db
+    return svc
+
+
+@pytest.mark.parametrize("service_cls", [ConsultationService, BusinessCaseService, CostEstimationService])
+class TestSaveFindings:
+
+    def _texts(self, db, session_id):
+        return {
+            f.factor_type: f.finding_text
+            for f in db.query(ConsultationFinding).filter(ConsultationFinding.session_id == session_id)
+        }
+
+    def test_inserts_and_updates(self, service_cls, db, session_id):
+        _make_service(service_cls, db)._save_findings(session_id, {
+            "ai_goals": "  new goals  ",
+            "project_plan": "Phase 1",
+        })
+        db.commit()
+        assert self._texts(db, session_id) == {"ai_goals": "new goals", "project_plan": "Phase 1"}
+
+    def test_skips_empty_and_placeholders(self, service_cls, db, session_id):
+        _make_service(service_cls, db)._save_findings(session_id, {
+            "ai_goals": "N/A",
+            "project_plan": None,
+            "open_risks": "   ",
+        })
+        db.commit()
+        assert self._texts(db, session_id) == {"ai_goals": "old"}
+
+    def test_single_select(self, service_cls, db, session_id):
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.get_bind(), "before_cursor_execute", listener)
+        try:
+            _make_service(service_cls, db)._save_findings(session_id, {
+                "ai_goals": "a", "project_plan": "b", "open_risks": "c",
+            })
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", listener)
+        assert sum(s.lstrip().upper().startswith("SELECT") for s in statements) == 1
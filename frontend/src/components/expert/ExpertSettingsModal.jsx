@@ -58,7 +58,7 @@ const ExpertSettingsModal = ({ isOpen, onClose, sessionUuid }) => {
       label: t('expertSettings.prompts.consultationContext'),
       shortLabel: t('expertSettings.prompts.tabs.consultContext'),
       description: t('expertSettings.prompts.consultationContextDesc'),
-      variables: ['company_name', 'company_info_text', 'maturity_section', 'focus_idea', 'top_ideas_text'],
+      variables: ['company_name', 'company_info_text', 'maturity_section', 'focus_idea', 'top_ideas_text', 'maturity_guidance_text'],
     },
     {
       key: 'extraction_summary',
@@ -73,7 +73,7 @@ const ExpertSettingsModal = ({ isOpen, onClose, sessionUuid }) => {
       label: t('expertSettings.prompts.businessCaseSystem'),
       shortLabel: t('expertSettings.prompts.tabs.bizCase'),
       description: t('expertSettings.prompts.businessCaseSystemDesc'),
-      variables: ['company_info_text', 'focus_idea', 'business_objectives', 'situation_assessment', 'ai_goals', 'project_plan'],
+      variables: ['company_info_text', 'focus_idea', 'business_objectives', 'situation_assessment', 'ai_goals', 'project_plan', 'maturity_context', 'technical_blockers'],
     },
     {
       key: 'business_case_extraction',
@@ -88,7 +88,7 @@ const ExpertSettingsModal = ({ isOpen, onClose, sessionUuid }) => {
       label: t('expertSettings.prompts.costEstimationSystem'),
       shortLabel: t('expertSettings.prompts.tabs.costSystem'),
       description: t('expertSettings.prompts.costEstimationSystemDesc'),
-      variables: ['company_info_text', 'focus_idea', 'business_objectives', 'situation_assessment', 'ai_goals', 'project_plan', 'potentials_summary'],
+      variables: ['company_info_text', 'focus_idea', 'business_objectives', 'situation_assessment', 'ai_goals', 'project_plan', 'potentials_summary', 'annual_benefit_eur'],
     },
     {
       key: 'cost_estimation_extraction',